@@ -351,17 +351,18 @@ type QbafRun struct {
 }
 
 type Recording struct {
-	ID         int32
-	CreatedAt  pgtype.Timestamptz
-	Name       pgtype.Text
-	AudioUrl   pgtype.Text
-	Transcript pgtype.Text
-	Summary    pgtype.Text
-	LocalAudio pgtype.Text
-	NasAudio   pgtype.Text
-	Duration   pgtype.Int4
-	Notes      pgtype.Text
-	Archived   pgtype.Bool
+	ID            int32
+	CreatedAt     pgtype.Timestamptz
+	Name          pgtype.Text
+	AudioUrl      pgtype.Text
+	Transcript    pgtype.Text
+	Summary       pgtype.Text
+	LocalAudio    pgtype.Text
+	NasAudio      pgtype.Text
+	Duration      pgtype.Int4
+	Notes         pgtype.Text
+	Archived      pgtype.Bool
+	ContentSha256 pgtype.Text
 }
 
 type Relation struct {
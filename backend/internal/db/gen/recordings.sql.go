@@ -33,7 +33,8 @@ SELECT
   r.nas_audio,
   r.duration,
   r.notes,
-  r.archived
+  r.archived,
+  r.content_sha256
 FROM recording r
 WHERE r.id = $1
 `
@@ -53,6 +54,7 @@ func (q *Queries) GetRecording(ctx context.Context, id int32) (Recording, error)
 		&i.Duration,
 		&i.Notes,
 		&i.Archived,
+		&i.ContentSha256,
 	)
 	return i, err
 }
@@ -115,7 +117,8 @@ SELECT
   r.nas_audio,
   r.duration,
   r.notes,
-  r.archived
+  r.archived,
+  r.content_sha256
 FROM recording r
 ORDER BY r.created_at DESC
 `
@@ -141,6 +144,7 @@ func (q *Queries) ListRecordings(ctx context.Context) ([]Recording, error) {
 			&i.Duration,
 			&i.Notes,
 			&i.Archived,
+			&i.ContentSha256,
 		); err != nil {
 			return nil, err
 		}
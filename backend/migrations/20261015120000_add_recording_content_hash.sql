@@ -0,0 +1,4 @@
+ALTER TABLE "public"."recording"
+  ADD COLUMN "content_sha256" text NULL;
+
+CREATE INDEX "recording_content_sha256_idx" ON "public"."recording" ("content_sha256");
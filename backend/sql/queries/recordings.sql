@@ -10,7 +10,8 @@ SELECT
   r.nas_audio,
   r.duration,
   r.notes,
-  r.archived
+  r.archived,
+  r.content_sha256
 FROM recording r
 ORDER BY r.created_at DESC;
 
@@ -26,7 +27,8 @@ SELECT
   r.nas_audio,
   r.duration,
   r.notes,
-  r.archived
+  r.archived,
+  r.content_sha256
 FROM recording r
 WHERE r.id = $1;
 
@@ -218,8 +218,11 @@ CREATE TABLE "public"."recording" (
   "duration" integer NULL,
   "notes" text NULL,
   "archived" boolean NULL,
+  "content_sha256" text NULL,
   PRIMARY KEY ("id")
 );
+-- Create index "recording_content_sha256_idx" to table: "recording"
+CREATE INDEX "recording_content_sha256_idx" ON "public"."recording" ("content_sha256");
 -- Create "directory" table
 CREATE TABLE "public"."directory" (
   "id" integer NOT NULL GENERATED ALWAYS AS IDENTITY,
@@ -1,6 +1,6 @@
 from textual.app import ComposeResult
 from textual import on
-from textual.events import Mount
+from textual.events import Mount, ScreenResume
 from textual.containers import Container
 from textual.widgets import Static, SelectionList
 from textual.widgets.selection_list import Selection
@@ -55,16 +55,21 @@ class AnalysisModal(ModalScreen):
             )
 
 
+    @on(ScreenResume)
+    def reset_selection(self) -> None:
+        """Clear the previous choice when the modal is shown again"""
+        self.query_one(SelectionList).deselect_all()
+
     @on(Mount)
     @on(SelectionList.SelectedChanged)
     def update_selection(self) -> None:
         selected = self.query_one(SelectionList).selected
-        logging.info(f"AnalysisModal: selection changed to: {selected}")
+        logging.info("AnalysisModal: selection changed to: %s", selected)
         
         # If something is selected and we have exactly one item, trigger analysis
         if selected and len(selected) == 1:
             selected_id = list(selected)[0]
-            logging.info(f"AnalysisModal: single item selected, dismissing with: {selected_id}")
+            logging.info("AnalysisModal: single item selected, dismissing with: %s", selected_id)
             self.dismiss(selected_id)
 
     def action_cancel(self):
@@ -39,10 +39,10 @@ class RenameModal(ModalScreen):
             yield Static("Rename Recording:", classes="dialog-title")
             yield Input(id="rename-input")
 
-    async def on_mount(self) -> None:
-        """Set the input value and focus after mount"""
+    async def on_screen_resume(self) -> None:
+        """Set the input value and focus each time the modal is shown"""
         logging.info(
-            f"RenameModal on_mount called with current_name: '{self.current_name}'"
+            f"RenameModal shown with current_name: '{self.current_name}'"
         )
         # Use a timer to set the value after a small delay
         self.set_timer(0.1, self.set_input_value)
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The app imports its packages top-level (db, services, ui, ...); make that
+# work when pytest is started from the repository root as well as from tui/.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -1,9 +1,12 @@
 from tortoise.models import Model
 from tortoise import fields
 from datetime import datetime
-from typing import Optional
+from functools import cached_property
+from typing import Optional, Tuple
 from zoneinfo import ZoneInfo
 
+CDMX_TZ = ZoneInfo("America/Mexico_City")
+
 
 class Recording(Model):
     id = fields.IntField(pk=True, generated=True)
@@ -17,6 +20,7 @@ class Recording(Model):
     duration = fields.IntField(null=True)  # Duration in seconds
     notes = fields.TextField(null=True)
     archived = fields.BooleanField(default=False)
+    content_sha256 = fields.TextField(null=True)  # Hash of the imported source file
 
     class Meta:
         table = "recording"
@@ -25,7 +29,7 @@ class Recording(Model):
     def __str__(self):
         return f"Recording({self.id}, {self.name})"
 
-    @property
+    @cached_property
     def duration_formatted(self) -> str:
         """Return duration in MM:SS format"""
         if not self.duration:
@@ -34,18 +38,18 @@ class Recording(Model):
         seconds = self.duration % 60
         return f"{minutes:02d}:{seconds:02d}"
 
-    @property
+    @cached_property
     def created_at_formatted(self) -> str:
         """Return formatted creation time in CDMX timezone"""
         if not self.created_at:
             return "Unknown"
         # Convert to CDMX timezone
-        cdmx_time = self.created_at.astimezone(ZoneInfo("America/Mexico_City"))
+        cdmx_time = self.created_at.astimezone(CDMX_TZ)
         return cdmx_time.strftime("%b %d %H:%M")
 
-    @property
-    def storage_status(self) -> str:
-        """Return storage status as local/NAS/cloud boolean string"""
+    @cached_property
+    def _storage_flags(self) -> Tuple[bool, bool, bool]:
+        """Check local, NAS and cloud availability once per instance"""
         import os
 
         # Check local storage
@@ -57,16 +61,21 @@ class Recording(Model):
         # Check cloud storage (Azure)
         has_cloud = bool(self.audio_url and self.audio_url.startswith("https://"))
 
-        return f"{'t' if has_local else 'f'}/{'t' if has_nas else 'f'}/{'t' if has_cloud else 'f'}"
+        return has_local, has_nas, has_cloud
+
+    def clear_storage_cache(self) -> None:
+        """Forget the cached storage checks after a location field changes"""
+        self.__dict__.pop("_storage_flags", None)
+
+    @property
+    def storage_status(self) -> str:
+        """Return storage status as local/NAS/cloud boolean string"""
+        return "/".join("t" if flag else "f" for flag in self._storage_flags)
 
     @property
     def storage_status_readable(self) -> str:
         """Return storage status as readable labels."""
-        import os
-
-        has_local = bool(self.local_audio and os.path.exists(self.local_audio))
-        has_nas = bool(self.nas_audio and os.path.exists(self.nas_audio))
-        has_cloud = bool(self.audio_url and self.audio_url.startswith("https://"))
+        has_local, has_nas, has_cloud = self._storage_flags
 
         return " | ".join(
             [
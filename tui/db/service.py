@@ -8,12 +8,20 @@ class RecordingService:
 
     @staticmethod
     async def create_recording(
-        name: str, local_audio_path: str = None, duration: int = None, notes: str = None
+        name: str,
+        local_audio_path: str = None,
+        duration: int = None,
+        notes: str = None,
+        content_sha256: str = None,
     ) -> Optional[Recording]:
         """Create a new recording entry"""
         try:
             recording = await Recording.create(
-                name=name, local_audio=local_audio_path, duration=duration, notes=notes
+                name=name,
+                local_audio=local_audio_path,
+                duration=duration,
+                notes=notes,
+                content_sha256=content_sha256,
             )
             return recording
         except Exception as e:
@@ -21,12 +29,26 @@ class RecordingService:
             return None
 
     @staticmethod
-    async def get_all_recordings(include_archived: bool = False) -> List[Recording]:
-        """Get all recordings ordered by creation time with analysis metadata"""
+    async def get_all_recordings_for_list(
+        include_archived: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Recording]:
+        """Get recordings for the TUI list, loading only the displayed columns.
+
+        The returned models are partial: transcript, summary and notes are not
+        fetched, only whether transcript and summary are present. Pass limit
+        and offset to fetch a single page, newest first.
+        """
         try:
+            from tortoise import connections
+
             where_clause = "" if include_archived else "WHERE r.archived = FALSE"
             query = f"""
-                SELECT r.*,
+                SELECT r.id, r.created_at, r.name, r.audio_url, r.local_audio,
+                       r.nas_audio, r.duration, r.archived,
+                       COALESCE(r.transcript, '') <> '' AS has_transcript,
+                       COALESCE(r.summary, '') <> '' AS has_summary,
                        COALESCE(s.has_speakers, FALSE) AS has_speakers,
                        COALESCE(t.has_todos, FALSE) AS has_todos
                 FROM recording r
@@ -41,33 +63,51 @@ class RecordingService:
                     GROUP BY created_at_recording_id
                 ) t ON t.recording_id = r.id
                 {where_clause}
-                ORDER BY r.created_at DESC
+                ORDER BY r.created_at DESC, r.id DESC
+                LIMIT $1 OFFSET $2
             """
 
-            recordings = await Recording.raw(query)
-
-            for recording in recordings:
-                has_speakers = bool(getattr(recording, "has_speakers", False))
-                has_todos = bool(getattr(recording, "has_todos", False))
-                has_summary = bool(recording.summary)
-                has_transcript = bool(recording.transcript)
-                status_parts = [
-                    f"{'✓' if has_speakers else '✗'} speakers",
-                    f"{'✓' if has_todos else '✗'} todos",
-                    f"{'✓' if has_summary else '✗'} summary",
-                ]
-                setattr(recording, "analysis_status", " | ".join(status_parts))
-                setattr(
-                    recording,
-                    "transcript_status",
-                    "Ready" if has_transcript else "Missing",
-                )
+            # LIMIT NULL means no limit in Postgres
+            rows = await connections.get("default").execute_query_dict(
+                query, [limit, offset]
+            )
+
+            recordings = []
+            for row in rows:
+                flags = {
+                    key: bool(row.pop(key))
+                    for key in ("has_speakers", "has_todos", "has_summary", "has_transcript")
+                }
+                recording = Recording._init_from_db(**row)
+                RecordingService._apply_list_status(recording, **flags)
+                recordings.append(recording)
 
             return recordings
         except Exception as e:
             logging.error(f"Error fetching recordings: {e}")
             return []
 
+    @staticmethod
+    def _apply_list_status(
+        recording: Recording,
+        *,
+        has_speakers: bool,
+        has_todos: bool,
+        has_summary: bool,
+        has_transcript: bool,
+    ) -> None:
+        status_parts = [
+            f"{'✓' if has_speakers else '✗'} speakers",
+            f"{'✓' if has_todos else '✗'} todos",
+            f"{'✓' if has_summary else '✗'} summary",
+        ]
+        setattr(recording, "analysis_status", " | ".join(status_parts))
+        setattr(
+            recording,
+            "transcript_status",
+            "Ready" if has_transcript else "Missing",
+        )
+
     @staticmethod
     async def get_recording_by_id(recording_id: int) -> Optional[Recording]:
         """Get a specific recording by ID"""
@@ -77,6 +117,15 @@ class RecordingService:
             logging.error(f"Error fetching recording: {e}")
             return None
 
+    @staticmethod
+    async def get_recording_by_content_hash(content_sha256: str) -> Optional[Recording]:
+        """Get the recording imported from a file with the given SHA-256"""
+        try:
+            return await Recording.filter(content_sha256=content_sha256).first()
+        except Exception as e:
+            logging.error(f"Error fetching recording by content hash: {e}")
+            return None
+
     @staticmethod
     async def update_recording(recording_id: int, **kwargs) -> bool:
         """Update recording fields"""
@@ -114,9 +163,9 @@ class RecordingService:
                 return False
 
             # Delete from all storage locations
-            from services.storage_manager import StorageManager
+            from services.storage_manager import get_storage_manager
 
-            storage_manager = StorageManager()
+            storage_manager = get_storage_manager()
             result = await storage_manager.delete_from_all_storage(recording)
 
             # Log any file deletion errors but still delete from database
@@ -151,6 +200,15 @@ class UserService:
             logging.error(f"Error fetching users: {e}")
             return []
 
+    @staticmethod
+    async def get_all_user_dicts() -> List[Dict]:
+        """Get all users as plain dicts with id, name and role"""
+        try:
+            return await User.all().values("id", "first_name", "last_name", "role")
+        except Exception as e:
+            logging.error(f"Error fetching users: {e}")
+            return []
+
     @staticmethod
     async def create_user(
         first_name: str, last_name: str, role: str = None
@@ -170,19 +228,22 @@ class SpeakerService:
     """Service class for speaker identification operations"""
 
     @staticmethod
-    async def save_speaker_mappings(recording_id: int, mappings: List[Dict]) -> bool:
+    async def save_speaker_mappings(
+        recording_id: int, mappings: List[Dict], using_db=None
+    ) -> bool:
         """Save speaker to user mappings for a recording"""
         try:
             from tortoise import connections
 
-            db = connections.get("default")
+            db = using_db or connections.get("default")
 
             # Clear existing mappings for this recording
             await db.execute_query(
                 "DELETE FROM speaker_to_user WHERE recording_id = $1", [recording_id]
             )
 
-            # Create new mappings
+            speaker_ids = []
+            user_ids = []
             for mapping in mappings:
                 # Ensure all values are integers
                 # Convert "Speaker 0" to just 0 (integer)
@@ -192,12 +253,15 @@ class SpeakerService:
                 else:
                     speaker_id = int(speaker_id)
 
-                user_id = int(mapping["user_id"])
-                recording_id_int = int(recording_id)
+                speaker_ids.append(speaker_id)
+                user_ids.append(int(mapping["user_id"]))
 
+            # Create new mappings in a single statement
+            if speaker_ids:
                 await db.execute_query(
-                    "INSERT INTO speaker_to_user (recording_id, speaker_id, user_id) VALUES ($1, $2, $3)",
-                    [recording_id_int, speaker_id, user_id],
+                    "INSERT INTO speaker_to_user (recording_id, speaker_id, user_id) "
+                    "SELECT $1, unnest($2::int[]), unnest($3::int[])",
+                    [int(recording_id), speaker_ids, user_ids],
                 )
 
             return True
@@ -10,11 +10,12 @@ import os
 # Add the current directory to Python path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from ui.main_app import RecordingApp
+from ui.main_app import RecordingApp, configure_logging
 
 
 def main():
     """Main entry point for the TUI application"""
+    configure_logging()
     app = RecordingApp()
     app.run()
 
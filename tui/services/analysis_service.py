@@ -6,7 +6,14 @@ from typing import Any, Dict, List, Tuple
 from .openai_client import get_openai_client, is_openai_configured
 
 
-def _run_completion_sync(prompt: str) -> Tuple[Any, Dict[str, str]]:
+def _run_completion_sync(
+    prompt: str, parse_json: bool = False
+) -> Tuple[str, Dict[str, str], Any]:
+    """Run the completion and, if asked, parse its JSON off the event loop
+
+    The parsed value is None when parse_json is False or the reply is not
+    valid JSON.
+    """
     client = get_openai_client()
     result = client.chat.completions.create(
         model="openai/gpt-5",
@@ -24,7 +31,15 @@ def _run_completion_sync(prompt: str) -> Tuple[Any, Dict[str, str]]:
         if "x-or-model" in headers:
             meta["header_model"] = headers["x-or-model"]
 
-    return result, meta
+    content = result.choices[0].message.content
+    parsed = None
+    if parse_json:
+        try:
+            parsed = json.loads(content)
+        except json.JSONDecodeError:
+            parsed = None
+
+    return content, meta, parsed
 
 
 async def analyze_transcript(
@@ -118,7 +133,9 @@ Transcript:
                 "error": True,
             }
 
-        result, meta = await asyncio.to_thread(_run_completion_sync, prompt)
+        content, meta, todo_data = await asyncio.to_thread(
+            _run_completion_sync, prompt, analysis_type == "todos"
+        )
 
         if meta.get("request_id"):
             logging.info("OpenRouter request ID: %s", meta["request_id"])
@@ -127,49 +144,46 @@ Transcript:
         if meta.get("header_model"):
             logging.info("OpenRouter model header: %s", meta["header_model"])
 
-        content = result.choices[0].message.content
-
         if analysis_type == "todos":
-            try:
-                # Parse JSON response for TODOs
-                todo_data = json.loads(content)
-                todos = todo_data.get("todos", [])
-
-                # Save TODOs to database
-                if todos and recording_id:
-                    from db.service import TodoService
-
-                    saved_count = 0
-                    for todo in todos:
-                        success = await TodoService.create_todo(
-                            name=todo.get("name"),
-                            desc=todo.get("desc"),
-                            status=todo.get("status", "todo"),
-                            user_id=todo.get("user_id"),
-                            created_at_recording_id=recording_id,
-                        )
-                        if success:
-                            saved_count += 1
-
-                    logging.info(
-                        f"Saved {saved_count}/{len(todos)} TODOs to database for recording {recording_id}"
-                    )
-
-                return {
-                    "type": analysis_type,
-                    "title": f"Extracted {len(todos)} TODO items",
-                    "content": content,
-                    "todos": todos,
-                    "recording_id": recording_id,
-                    "success": True,
-                }
-            except json.JSONDecodeError:
+            # The JSON response for TODOs was parsed on the worker thread
+            if todo_data is None:
                 return {
                     "type": analysis_type,
                     "title": "TODO Analysis",
                     "content": f"Failed to parse JSON response: {content}",
                     "error": True,
                 }
+
+            todos = todo_data.get("todos", [])
+
+            # Save TODOs to database
+            if todos and recording_id:
+                from db.service import TodoService
+
+                saved_count = 0
+                for todo in todos:
+                    success = await TodoService.create_todo(
+                        name=todo.get("name"),
+                        desc=todo.get("desc"),
+                        status=todo.get("status", "todo"),
+                        user_id=todo.get("user_id"),
+                        created_at_recording_id=recording_id,
+                    )
+                    if success:
+                        saved_count += 1
+
+                logging.info(
+                    f"Saved {saved_count}/{len(todos)} TODOs to database for recording {recording_id}"
+                )
+
+            return {
+                "type": analysis_type,
+                "title": f"Extracted {len(todos)} TODO items",
+                "content": content,
+                "todos": todos,
+                "recording_id": recording_id,
+                "success": True,
+            }
         else:
             # For summary, also save to database
             if analysis_type == "summary" and recording_id:
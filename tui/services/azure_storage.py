@@ -1,9 +1,12 @@
 import asyncio
 import base64
+import email.utils
+import functools
 import hashlib
 import hmac
+import logging
 import os
-from datetime import datetime, timezone
+import time
 from typing import Dict, Optional
 from urllib.parse import quote
 
@@ -13,6 +16,21 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+_last_t = 0
+_last_s = ""
+
+
+def _http_date_now() -> str:
+    """Return the current RFC 7231 date, formatted at most once per second"""
+    global _last_t, _last_s
+    now = int(time.time())
+    if now != _last_t:
+        # Publish the string before the second so worker threads never pair
+        # a fresh timestamp with a stale header value.
+        _last_s = email.utils.formatdate(now, usegmt=True)
+        _last_t = now
+    return _last_s
+
 
 class AzureBlobStorage:
     def __init__(self, connection_string: str):
@@ -23,6 +41,7 @@ class AzureBlobStorage:
         self.account_name = None
         self.account_key = None
         self.endpoint_suffix = "core.windows.net"
+        self._session = requests.Session()
         
         self._parse_connection_string()
         
@@ -31,14 +50,10 @@ class AzureBlobStorage:
     
     def _parse_connection_string(self):
         """Parse Azure connection string to extract account name and key"""
-        parts = self.connection_string.split(';')
-        for part in parts:
-            if part.startswith('AccountName='):
-                self.account_name = part.split('=', 1)[1]
-            elif part.startswith('AccountKey='):
-                self.account_key = part.split('=', 1)[1]
-            elif part.startswith('EndpointSuffix='):
-                self.endpoint_suffix = part.split('=', 1)[1]
+        kv = dict(p.split('=', 1) for p in self.connection_string.split(';') if '=' in p)
+        self.account_name = kv.get('AccountName')
+        self.account_key = kv.get('AccountKey')
+        self.endpoint_suffix = kv.get('EndpointSuffix', self.endpoint_suffix)
     
     def _get_authorization_header(self, method: str, url_path: str, headers: dict) -> str:
         """Generate Azure Storage authorization header"""
@@ -95,14 +110,10 @@ class AzureBlobStorage:
         url_path = f"/{container_name}/{encoded_blob_name}"
         url = f"https://{self.account_name}.blob.{self.endpoint_suffix}{url_path}"
 
-        with open(file_path, "rb") as f:
-            file_content = f.read()
-
-        file_size = len(file_content)
+        file_size = os.path.getsize(file_path)
 
-        utc_now = datetime.now(timezone.utc)
         headers = {
-            "x-ms-date": utc_now.strftime("%a, %d %b %Y %H:%M:%S GMT"),
+            "x-ms-date": _http_date_now(),
             "x-ms-version": "2020-04-08",
             "x-ms-blob-type": "BlockBlob",
             "Content-Length": str(file_size),
@@ -112,7 +123,10 @@ class AzureBlobStorage:
         auth_header = self._get_authorization_header("PUT", url_path, headers)
         headers["Authorization"] = auth_header
 
-        response = requests.put(url, data=file_content, headers=headers)
+        # Hand requests the open file so the body is streamed in bounded chunks
+        # instead of being read into memory up front.
+        with open(file_path, "rb") as f:
+            response = self._session.put(url, data=f, headers=headers)
 
         if response.status_code in [200, 201]:
             return {
@@ -134,16 +148,15 @@ class AzureBlobStorage:
         url_path = f"/{container_name}/{encoded_blob_name}"
         url = f"https://{self.account_name}.blob.{self.endpoint_suffix}{url_path}"
 
-        utc_now = datetime.now(timezone.utc)
         headers = {
-            "x-ms-date": utc_now.strftime("%a, %d %b %Y %H:%M:%S GMT"),
+            "x-ms-date": _http_date_now(),
             "x-ms-version": "2020-04-08",
         }
 
         auth_header = self._get_authorization_header("DELETE", url_path, headers)
         headers["Authorization"] = auth_header
 
-        response = requests.delete(url, headers=headers)
+        response = self._session.delete(url, headers=headers)
 
         if response.status_code in [200, 202, 404]:
             return {
@@ -158,6 +171,10 @@ class AzureBlobStorage:
             "status_code": response.status_code,
         }
 
+    def close(self) -> None:
+        """Close pooled HTTP connections"""
+        self._session.close()
+
     async def upload_file(
         self,
         file_path: str,
@@ -176,3 +193,27 @@ class AzureBlobStorage:
         return await asyncio.to_thread(
             self._delete_file_sync, blob_name, container_name
         )
+
+
+@functools.lru_cache(maxsize=1)
+def get_azure_storage() -> Optional[AzureBlobStorage]:
+    """Return the shared Azure client, or None when it is not configured"""
+    conn_str = os.getenv("AZURE_CONNECTION_STRING")
+    if not conn_str:
+        logging.warning("AZURE_CONNECTION_STRING is not set")
+        return None
+
+    try:
+        return AzureBlobStorage(conn_str)
+    except ValueError as e:
+        logging.error(f"Failed to initialize Azure Storage: {e}")
+        return None
+
+
+def close_azure_storage() -> None:
+    """Close the shared Azure client if one was created"""
+    if get_azure_storage.cache_info().currsize:
+        storage = get_azure_storage()
+        if storage:
+            storage.close()
+        get_azure_storage.cache_clear()
@@ -1,4 +1,5 @@
 import asyncio
+import hashlib
 import logging
 import shutil
 from datetime import datetime
@@ -13,6 +14,8 @@ from services.audio_files import (
     get_audio_duration_seconds,
 )
 
+HASH_CHUNK_SIZE = 1024 * 1024
+
 
 class RecordingImporter:
     """Handle importing existing audio files into the local recordings store."""
@@ -38,6 +41,22 @@ class RecordingImporter:
         if extension not in {".wav", ".m4a", ".mp4"}:
             return {"success": False, "error": "Only wav, m4a, and mp4 files are supported"}
 
+        try:
+            content_sha256 = await asyncio.to_thread(_hash_file, source)
+        except OSError as exc:
+            logging.error("Failed hashing %s: %s", source, exc)
+            return {"success": False, "error": "Failed to read audio"}
+
+        existing = await RecordingService.get_recording_by_content_hash(content_sha256)
+        if existing:
+            return {
+                "success": True,
+                "recording_id": existing.id,
+                "path": existing.local_audio,
+                "duration": existing.duration,
+                "duplicate": True,
+            }
+
         final_name = source.name if extension == ".m4a" else f"{source.stem}.m4a"
         destination = self.recordings_dir / final_name
         if destination.exists():
@@ -63,6 +82,7 @@ class RecordingImporter:
             name=recording_name,
             local_audio_path=str(destination),
             duration=duration,
+            content_sha256=content_sha256,
         )
 
         if not recording:
@@ -74,3 +94,11 @@ class RecordingImporter:
             "path": str(destination),
             "duration": duration,
         }
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
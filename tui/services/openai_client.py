@@ -5,6 +5,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 OPENROUTER_API_KEY = os.getenv('OPENROUTER_API_KEY')
+OPENAI_CONFIGURED = bool(OPENROUTER_API_KEY)
 
 # Common OpenAI client configuration
 client = OpenAI(
@@ -18,4 +19,4 @@ def get_openai_client():
 
 def is_openai_configured():
     """Check if OpenAI API key is configured"""
-    return bool(OPENROUTER_API_KEY)
\ No newline at end of file
+    return OPENAI_CONFIGURED
\ No newline at end of file
@@ -6,6 +6,34 @@ from typing import Any, Dict, List
 from .openai_client import get_openai_client, is_openai_configured
 
 
+SPEAKER_IDENTIFICATION_PROMPT = """Analyze this diarized transcript and identify which speaker corresponds to which user based on contextual clues like:
+- Direct name mentions ("My name is...", "I'm...")
+- People addressing each other by name
+- Role or title references
+- Context clues from conversation flow
+
+Users available:
+{users}
+
+Transcript:
+{transcript}
+
+Return ONLY a JSON object with this exact structure:
+{{
+  "speaker_mappings": [
+    {{
+      "speaker_id": "Speaker 0",
+      "user_id": 123,
+      "confidence": "high|medium|low",
+      "reasoning": "Brief explanation of why this mapping was made"
+    }}
+  ]
+}}
+
+If you cannot confidently identify a speaker, do not include them in the mappings.
+"""
+
+
 def _identify_speakers_sync(prompt: str) -> Any:
     client = get_openai_client()
     return client.chat.completions.create(
@@ -38,32 +66,9 @@ async def identify_speakers_in_transcript(transcript: str, users: List[Dict], re
                 user_str += f", Role: {user['role']}"
             users_info.append(user_str)
         
-        prompt = f"""Analyze this diarized transcript and identify which speaker corresponds to which user based on contextual clues like:
-- Direct name mentions ("My name is...", "I'm...")
-- People addressing each other by name
-- Role or title references
-- Context clues from conversation flow
-
-Users available:
-{chr(10).join(users_info)}
-
-Transcript:
-{transcript}
-
-Return ONLY a JSON object with this exact structure:
-{{
-  "speaker_mappings": [
-    {{
-      "speaker_id": "Speaker 0",
-      "user_id": 123,
-      "confidence": "high|medium|low",
-      "reasoning": "Brief explanation of why this mapping was made"
-    }}
-  ]
-}}
-
-If you cannot confidently identify a speaker, do not include them in the mappings.
-"""
+        prompt = SPEAKER_IDENTIFICATION_PROMPT.format(
+            users="\n".join(users_info), transcript=transcript
+        )
         
         result = await asyncio.to_thread(_identify_speakers_sync, prompt)
         content = result.choices[0].message.content
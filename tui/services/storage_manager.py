@@ -1,49 +1,114 @@
 import asyncio
+import errno
+import functools
 import os
 import shutil
-from typing import Any, Dict, Optional
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import unquote, urlparse
 
 import requests
 
-from services.azure_storage import AzureBlobStorage
+from services.azure_storage import AzureBlobStorage, get_azure_storage
 from services.audio_files import CANONICAL_AUDIO_SUFFIX, storage_name
 from db.service import RecordingService
 import logging
 
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+COPY_FILE_RANGE_CHUNK_SIZE = 64 * 1024 * 1024
+CLOUD_PROBE_TIMEOUT = 1.0
+CLOUD_PROBE_TTL = 60.0
+
+# copy_file_range is unsupported for this pair of files; use a regular copy.
+_COPY_FILE_RANGE_FALLBACK_ERRNOS = {
+    errno.ENOSYS,
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+}
+
+_http_session: Optional[requests.Session] = None
+
+
+def _get_http_session() -> requests.Session:
+    """Return a shared HTTP session so downloads reuse pooled connections"""
+    global _http_session
+    if _http_session is None:
+        _http_session = requests.Session()
+    return _http_session
+
+
+@dataclass(frozen=True)
+class SourceStatus:
+    """Which storage locations currently hold a recording's audio"""
+
+    local: bool
+    nas: bool
+    cloud: bool
+
+    @property
+    def count(self) -> int:
+        return int(self.local) + int(self.nas) + int(self.cloud)
+
 
 class StorageManager:
     def __init__(self):
         self.nas_dir = "/Volumes/s3/sec-recordings"
-        conn_str = os.getenv("AZURE_CONNECTION_STRING")
-        if not conn_str:
-            logging.warning("AZURE_CONNECTION_STRING is not set")
-            # We can still initialize, but cloud ops will fail. 
-            # Or we can raise. Given the usage, maybe better to warn?
-            # Existing code passed None which caused AzureBlobStorage to have None connection_string.
-            # My updated AzureBlobStorage raises ValueError on None.
-            # So we should probably handle it gracefully here if we want the app to start without cloud.
-            self.azure_storage = None
-        else:
-            try:
-                self.azure_storage = AzureBlobStorage(conn_str)
-            except ValueError as e:
-                logging.error(f"Failed to initialize Azure Storage: {e}")
-                self.azure_storage = None
+        self._cloud_probe_cache: Dict[str, Tuple[bool, float]] = {}
+
+    @property
+    def azure_storage(self) -> Optional[AzureBlobStorage]:
+        """Shared Azure client, created on first cloud operation
+
+        Cloud operations report "not configured" when this is None.
+        """
+        return get_azure_storage()
 
     def _download_from_cloud_sync(self, url: str, dest_path: str) -> bool:
-        response = requests.get(url, stream=True)
-        response.raise_for_status()
+        with _get_http_session().get(url, stream=True) as response:
+            response.raise_for_status()
 
-        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+            os.makedirs(os.path.dirname(dest_path), exist_ok=True)
 
-        with open(dest_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+            with open(dest_path, "wb", buffering=0) as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
 
         return True
 
+    def _copy_file_range_sync(self, source: str, dest: str) -> bool:
+        """Copy with os.copy_file_range; return False if the copy came up short"""
+        with open(source, "rb") as src, open(dest, "wb") as dst:
+            remaining = os.fstat(src.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(
+                    src.fileno(),
+                    dst.fileno(),
+                    min(remaining, COPY_FILE_RANGE_CHUNK_SIZE),
+                )
+                if copied == 0:
+                    break
+                remaining -= copied
+        return remaining == 0
+
     def _copy_file_sync(self, source: str, dest: str) -> bool:
-        shutil.copy2(source, dest)
+        # copy_file_range lets the kernel reflink or do an NFS server-side copy.
+        if hasattr(os, "copy_file_range"):
+            try:
+                if self._copy_file_range_sync(source, dest):
+                    return True
+                logging.warning(
+                    "copy_file_range stopped early copying %s; retrying with copyfile",
+                    source,
+                )
+            except OSError as exc:
+                if exc.errno not in _COPY_FILE_RANGE_FALLBACK_ERRNOS:
+                    raise
+
+        # copyfile skips the metadata pass and takes the sendfile/fcopyfile fast path.
+        shutil.copyfile(source, dest)
         return True
 
     def _remove_file_sync(self, path: str) -> None:
@@ -59,40 +124,68 @@ class StorageManager:
             logging.error(f"Failed to download from {url}: {e}")
             return False
     
-    async def get_first_available_source(self, recording) -> Optional[Dict[str, str]]:
+    @staticmethod
+    def _blob_name(recording) -> str:
+        """Return the blob key the recording was uploaded under"""
+        # Read it back from audio_url so a rename after upload still targets the right blob
+        if recording.audio_url:
+            return unquote(urlparse(recording.audio_url).path.split("/", 2)[-1])
+        return storage_name(recording, CANONICAL_AUDIO_SUFFIX)
+
+    def _probe_sources_sync(self, recording) -> SourceStatus:
+        return SourceStatus(
+            local=bool(recording.local_audio and os.path.exists(recording.local_audio)),
+            nas=bool(recording.nas_audio and os.path.exists(recording.nas_audio)),
+            cloud=bool(recording.audio_url and recording.audio_url.startswith('https://')),
+        )
+
+    async def _probe_sources(self, recording) -> SourceStatus:
+        """Stat every storage location once so callers can share the result"""
+        return await asyncio.to_thread(self._probe_sources_sync, recording)
+
+    def _probe_cloud_sync(self, url: str) -> Optional[bool]:
+        try:
+            response = _get_http_session().head(url, timeout=CLOUD_PROBE_TIMEOUT)
+        except requests.RequestException as e:
+            logging.debug("Cloud probe for %s failed: %s", url, e)
+            return None
+        return response.status_code < 400
+
+    async def _probe_cloud(self, url: str) -> bool:
+        """Check that a cloud URL is still live, caching the answer briefly"""
+        cached = self._cloud_probe_cache.get(url)
+        if cached and time.monotonic() - cached[1] < CLOUD_PROBE_TTL:
+            return cached[0]
+
+        available = await asyncio.to_thread(self._probe_cloud_sync, url)
+        if available is None:
+            # Unreachable is not proof the blob is gone; let the real transfer decide
+            return True
+
+        self._cloud_probe_cache[url] = (available, time.monotonic())
+        return available
+
+    async def get_first_available_source(
+        self, recording, status: Optional[SourceStatus] = None
+    ) -> Optional[Dict[str, str]]:
         """Return info about first available file source"""
+        if status is None:
+            status = await self._probe_sources(recording)
+
         # Check local first
-        if recording.local_audio and os.path.exists(recording.local_audio):
+        if status.local:
             return {"type": "local", "path": recording.local_audio}
         
         # Check NAS second
-        if recording.nas_audio and os.path.exists(recording.nas_audio):
+        if status.nas:
             return {"type": "nas", "path": recording.nas_audio}
         
         # Check cloud third
-        if recording.audio_url and recording.audio_url.startswith('https://'):
+        if status.cloud and await self._probe_cloud(recording.audio_url):
             return {"type": "cloud", "path": recording.audio_url}
         
         return None
     
-    def count_storage_locations(self, recording) -> int:
-        """Count how many storage locations have the recording"""
-        count = 0
-        
-        # Check local
-        if recording.local_audio and os.path.exists(recording.local_audio):
-            count += 1
-            
-        # Check NAS
-        if recording.nas_audio and os.path.exists(recording.nas_audio):
-            count += 1
-            
-        # Check cloud
-        if recording.audio_url and recording.audio_url.startswith('https://'):
-            count += 1
-            
-        return count
-    
     async def copy_from_source(self, source_info: Dict[str, str], dest_path: str) -> bool:
         """Copy file from source to destination"""
         if source_info["type"] == "cloud":
@@ -107,38 +200,46 @@ class StorageManager:
                 logging.error(f"Failed to copy from {source_info['path']}: {e}")
                 return False
     
+    @staticmethod
+    async def _update_location(recording, **fields) -> None:
+        """Persist storage location fields and mirror them on the in-memory recording"""
+        await RecordingService.update_recording(recording.id, **fields)
+        for key, value in fields.items():
+            setattr(recording, key, value)
+        recording.clear_storage_cache()
+
     async def toggle_local_storage(self, recording) -> Dict[str, Any]:
         """Toggle local storage for a recording"""
-        has_local = recording.local_audio and os.path.exists(recording.local_audio)
+        status = await self._probe_sources(recording)
         
-        if has_local:
+        if status.local:
             # Check if this is the only storage location
-            if self.count_storage_locations(recording) <= 1:
+            if status.count <= 1:
                 return {"success": False, "error": "Cannot delete the only remaining copy"}
             
             # Delete local file
             try:
                 await asyncio.to_thread(self._remove_file_sync, recording.local_audio)
-                await RecordingService.update_recording(recording.id, local_audio=None)
-                return {"success": True, "action": "deleted", "message": "Deleted local file"}
+                await self._update_location(recording, local_audio=None)
+                return {"success": True, "action": "deleted", "message": "Deleted local file", "recording": recording}
             except Exception as e:
                 return {"success": False, "error": f"Failed to delete local file: {e}"}
         else:
             # Copy from first available source to local
-            source_info = await self.get_first_available_source(recording)
+            source_info = await self.get_first_available_source(recording, status)
             if not source_info:
                 return {"success": False, "error": "No source file available to copy"}
             
             try:
                 # Ensure local recordings directory exists
                 local_dir = "recordings"
-                os.makedirs(local_dir, exist_ok=True)
+                await asyncio.to_thread(os.makedirs, local_dir, exist_ok=True)
                 
                 local_path = os.path.join(local_dir, storage_name(recording, source_info["path"]))
                 
                 if await self.copy_from_source(source_info, local_path):
-                    await RecordingService.update_recording(recording.id, local_audio=local_path)
-                    return {"success": True, "action": "copied", "message": f"Copied to local from {source_info['type']}: {local_path}"}
+                    await self._update_location(recording, local_audio=local_path)
+                    return {"success": True, "action": "copied", "message": f"Copied to local from {source_info['type']}: {local_path}", "recording": recording}
                 else:
                     return {"success": False, "error": f"Failed to copy from {source_info['type']}"}
             except Exception as e:
@@ -146,35 +247,35 @@ class StorageManager:
     
     async def toggle_nas_storage(self, recording) -> Dict[str, Any]:
         """Toggle NAS storage for a recording"""
-        has_nas = recording.nas_audio and os.path.exists(recording.nas_audio)
+        status = await self._probe_sources(recording)
         
-        if has_nas:
+        if status.nas:
             # Check if this is the only storage location
-            if self.count_storage_locations(recording) <= 1:
+            if status.count <= 1:
                 return {"success": False, "error": "Cannot delete the only remaining copy"}
             
             # Delete NAS file
             try:
                 await asyncio.to_thread(self._remove_file_sync, recording.nas_audio)
-                await RecordingService.update_recording(recording.id, nas_audio=None)
-                return {"success": True, "action": "deleted", "message": "Deleted NAS file"}
+                await self._update_location(recording, nas_audio=None)
+                return {"success": True, "action": "deleted", "message": "Deleted NAS file", "recording": recording}
             except Exception as e:
                 return {"success": False, "error": f"Failed to delete NAS file: {e}"}
         else:
             # Copy from first available source to NAS
-            source_info = await self.get_first_available_source(recording)
+            source_info = await self.get_first_available_source(recording, status)
             if not source_info:
                 return {"success": False, "error": "No source file available to copy"}
             
-            if not os.path.exists(self.nas_dir):
+            if not await asyncio.to_thread(os.path.exists, self.nas_dir):
                 return {"success": False, "error": f"NAS directory not available: {self.nas_dir}"}
             
             try:
                 nas_path = os.path.join(self.nas_dir, storage_name(recording, source_info["path"]))
                 
                 if await self.copy_from_source(source_info, nas_path):
-                    await RecordingService.update_recording(recording.id, nas_audio=nas_path)
-                    return {"success": True, "action": "copied", "message": f"Copied to NAS from {source_info['type']}: {nas_path}"}
+                    await self._update_location(recording, nas_audio=nas_path)
+                    return {"success": True, "action": "copied", "message": f"Copied to NAS from {source_info['type']}: {nas_path}", "recording": recording}
                 else:
                     return {"success": False, "error": f"Failed to copy from {source_info['type']}"}
             except Exception as e:
@@ -185,28 +286,28 @@ class StorageManager:
         if not self.azure_storage:
             return {"success": False, "error": "Azure Storage not configured"}
 
-        has_cloud = recording.audio_url and recording.audio_url.startswith('https://')
+        status = await self._probe_sources(recording)
         
-        if has_cloud:
+        if status.cloud:
             # Check if this is the only storage location
-            if self.count_storage_locations(recording) <= 1:
+            if status.count <= 1:
                 return {"success": False, "error": "Cannot delete the only remaining copy"}
             
             # Delete cloud file
             try:
-                blob_name = storage_name(recording, recording.audio_url or CANONICAL_AUDIO_SUFFIX)
+                blob_name = self._blob_name(recording)
                 result = await self.azure_storage.delete_file(blob_name)
                 
                 if result['success']:
-                    await RecordingService.update_recording(recording.id, audio_url=None)
-                    return {"success": True, "action": "deleted", "message": "Deleted cloud file"}
+                    await self._update_location(recording, audio_url=None)
+                    return {"success": True, "action": "deleted", "message": "Deleted cloud file", "recording": recording}
                 else:
                     return {"success": False, "error": f"Failed to delete cloud file: {result.get('error', 'Unknown error')}"}
             except Exception as e:
                 return {"success": False, "error": f"Failed to delete cloud file: {e}"}
         else:
             # Upload from first available source to cloud
-            source_info = await self.get_first_available_source(recording)
+            source_info = await self.get_first_available_source(recording, status)
             if not source_info:
                 return {"success": False, "error": "No source file available to upload"}
             
@@ -221,51 +322,68 @@ class StorageManager:
                 )
                 
                 if result['success']:
-                    await RecordingService.update_recording(recording.id, audio_url=result['url'])
-                    return {"success": True, "action": "uploaded", "message": f"Uploaded to cloud from {source_info['type']}: {result['url']}"}
+                    await self._update_location(recording, audio_url=result['url'])
+                    return {"success": True, "action": "uploaded", "message": f"Uploaded to cloud from {source_info['type']}: {result['url']}", "recording": recording}
                 else:
                     return {"success": False, "error": result.get('error', 'Upload failed')}
             except Exception as e:
                 return {"success": False, "error": f"Failed to upload to cloud: {e}"}
     
+    async def _delete_local_copy(self, recording) -> Tuple[str, Optional[str]]:
+        try:
+            await asyncio.to_thread(self._remove_file_sync, recording.local_audio)
+            return "local", None
+        except Exception as e:
+            return "local", f"Failed to delete local file: {e}"
+
+    async def _delete_nas_copy(self, recording) -> Tuple[str, Optional[str]]:
+        try:
+            await asyncio.to_thread(self._remove_file_sync, recording.nas_audio)
+            return "NAS", None
+        except Exception as e:
+            return "NAS", f"Failed to delete NAS file: {e}"
+
+    async def _delete_cloud_copy(self, recording) -> Tuple[str, Optional[str]]:
+        if not self.azure_storage:
+            return "cloud", "Azure Storage not configured"
+        try:
+            blob_name = self._blob_name(recording)
+            result = await self.azure_storage.delete_file(blob_name)
+            if result['success']:
+                return "cloud", None
+            return "cloud", f"Failed to delete cloud file: {result.get('error', 'Unknown error')}"
+        except Exception as e:
+            return "cloud", f"Failed to delete cloud file: {e}"
+
     async def delete_from_all_storage(self, recording) -> Dict[str, Any]:
         """Delete recording from all storage locations"""
         deleted_locations = []
         errors = []
-        
-        # Delete from local
-        if recording.local_audio and os.path.exists(recording.local_audio):
-            try:
-                os.remove(recording.local_audio)
-                deleted_locations.append("local")
-            except Exception as e:
-                errors.append(f"Failed to delete local file: {e}")
-        
-        # Delete from NAS
-        if recording.nas_audio and os.path.exists(recording.nas_audio):
-            try:
-                os.remove(recording.nas_audio)
-                deleted_locations.append("NAS")
-            except Exception as e:
-                errors.append(f"Failed to delete NAS file: {e}")
-        
-        # Delete from cloud
-        if recording.audio_url and recording.audio_url.startswith('https://'):
-            if self.azure_storage:
-                try:
-                    blob_name = storage_name(recording, recording.audio_url or CANONICAL_AUDIO_SUFFIX)
-                    result = await self.azure_storage.delete_file(blob_name)
-                    if result['success']:
-                        deleted_locations.append("cloud")
-                    else:
-                        errors.append(f"Failed to delete cloud file: {result.get('error', 'Unknown error')}")
-                except Exception as e:
-                    errors.append(f"Failed to delete cloud file: {e}")
+        status = await self._probe_sources(recording)
+
+        # The locations are independent, so delete them concurrently
+        deletions = []
+        if status.local:
+            deletions.append(self._delete_local_copy(recording))
+        if status.nas:
+            deletions.append(self._delete_nas_copy(recording))
+        if status.cloud:
+            deletions.append(self._delete_cloud_copy(recording))
+
+        for location, error in await asyncio.gather(*deletions):
+            if error:
+                errors.append(error)
             else:
-                errors.append("Azure Storage not configured")
+                deleted_locations.append(location)
         
         return {
             "deleted_locations": deleted_locations,
             "errors": errors,
             "success": len(deleted_locations) > 0
         }
+
+
+@functools.lru_cache(maxsize=1)
+def get_storage_manager() -> StorageManager:
+    """Return the StorageManager shared by all screens"""
+    return StorageManager()
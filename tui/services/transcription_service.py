@@ -1,12 +1,36 @@
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+from tortoise.transactions import in_transaction
+
 from .deepgram_service import transcribe_from_url, transcribe_from_file
 from .speaker_identification import identify_speakers_in_transcript
 from db.service import RecordingService, UserService, SpeakerService
 
+USERS_CACHE_TTL = 30.0
+
+_users_cache: Optional[Tuple[float, List[Dict]]] = None
+
+
+async def _get_users_for_identification() -> List[Dict]:
+    """Return users in the dict format speaker identification expects"""
+    global _users_cache
+    if _users_cache and time.monotonic() - _users_cache[0] < USERS_CACHE_TTL:
+        return _users_cache[1]
+
+    users_dict = await UserService.get_all_user_dicts()
+    if users_dict:
+        _users_cache = (time.monotonic(), users_dict)
+    return users_dict
+
 
 class TranscriptionService:
     """Orchestrates the full transcription and speaker identification workflow"""
+
+    # Strong references so background speaker identification isn't garbage collected
+    _background_tasks: Set[asyncio.Task] = set()
     
     @staticmethod
     async def transcribe_recording(recording, source_info: Dict[str, str]) -> Dict[str, Any]:
@@ -20,14 +44,26 @@ class TranscriptionService:
         Returns:
             Dict with success status and any error messages
         """
+        # Load the users for speaker identification while Deepgram transcribes
+        users_task = asyncio.create_task(_get_users_for_identification())
         try:
-            # Step 1: Transcribe the audio
-            if source_info["type"] == "cloud":
-                transcription_result = await transcribe_from_url(source_info["path"])
+            # Step 1: Transcribe the audio, letting Deepgram pull from the
+            # cloud copy when one exists rather than uploading the file
+            audio_url = recording.audio_url if source_info["type"] != "cloud" else source_info["path"]
+            if audio_url and audio_url.startswith("https://"):
+                transcription_result = await transcribe_from_url(audio_url)
+                if not transcription_result.get("success") and source_info["type"] != "cloud":
+                    logging.warning(
+                        "URL transcription failed for recording %s, uploading %s instead",
+                        recording.id,
+                        source_info["type"],
+                    )
+                    transcription_result = await transcribe_from_file(source_info["path"])
             else:
                 transcription_result = await transcribe_from_file(source_info["path"])
             
             if not transcription_result.get("success"):
+                users_task.cancel()
                 return {
                     "success": False,
                     "error": f"Transcription failed: {transcription_result.get('error', 'Unknown error')}"
@@ -40,19 +76,26 @@ class TranscriptionService:
                 recording.id, transcript=transcript
             )
             
-            # Step 3: Run speaker identification if users exist
-            speaker_result = await TranscriptionService._identify_speakers(
-                transcript, recording.id
+            # Step 3: Run speaker identification in the background so the
+            # transcript is usable as soon as it is saved
+            speaker_task = asyncio.create_task(
+                TranscriptionService._identify_speakers(
+                    transcript, recording.id, users_task
+                )
             )
+            TranscriptionService._background_tasks.add(speaker_task)
+            speaker_task.add_done_callback(TranscriptionService._background_tasks.discard)
             
             return {
                 "success": True,
                 "transcript": transcript,
-                "speaker_mappings": speaker_result.get("mappings", []),
-                "speaker_identification_success": speaker_result.get("success", False)
+                "speaker_mappings": [],
+                "speaker_identification_success": False,
+                "speaker_task": speaker_task,
             }
             
         except Exception as e:
+            users_task.cancel()
             logging.error(f"Error in transcription workflow: {e}")
             return {
                 "success": False,
@@ -60,33 +103,46 @@ class TranscriptionService:
             }
     
     @staticmethod
-    async def _identify_speakers(transcript: str, recording_id: int) -> Dict[str, Any]:
+    async def _save_speaker_mappings(recording_id: int, mappings: List[Dict]) -> bool:
+        """Run the mapping DELETE+INSERT in one transaction"""
+        try:
+            async with in_transaction() as conn:
+                if not await SpeakerService.save_speaker_mappings(
+                    recording_id, mappings, using_db=conn
+                ):
+                    # Raise so the DELETE is rolled back along with the insert
+                    raise RuntimeError("Failed to save speaker mappings")
+            return True
+        except Exception as e:
+            logging.error("Error saving speaker mappings: %s", e)
+            return False
+
+    @staticmethod
+    async def _identify_speakers(
+        transcript: str,
+        recording_id: int,
+        users_task: Optional["asyncio.Task[List[Dict]]"] = None,
+    ) -> Dict[str, Any]:
         """Internal method to handle speaker identification"""
         try:
-            # Get all users from database
-            users = await UserService.get_all_users()
-            if not users:
+            # Get all users from database (cached briefly across transcriptions),
+            # reusing the lookup started alongside the transcription if given
+            if users_task is not None:
+                users_dict = await users_task
+            else:
+                users_dict = await _get_users_for_identification()
+            if not users_dict:
                 logging.info("No users found in database, skipping speaker identification")
                 return {"success": False, "error": "No users available"}
             
-            # Convert users to dict format for the service
-            users_dict = []
-            for user in users:
-                users_dict.append({
-                    "id": user.id,
-                    "first_name": user.first_name,
-                    "last_name": user.last_name,
-                    "role": user.role
-                })
-            
             # Run speaker identification
             result = await identify_speakers_in_transcript(
                 transcript, users_dict, recording_id
             )
             
             if result.get("success") and result.get("mappings"):
-                # Save mappings to database
-                success = await SpeakerService.save_speaker_mappings(
+                # Replace the mappings atomically so a failed insert keeps the old ones
+                success = await TranscriptionService._save_speaker_mappings(
                     recording_id, result["mappings"]
                 )
                 if success:
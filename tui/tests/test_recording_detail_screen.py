@@ -0,0 +1,70 @@
+import asyncio
+import contextlib
+from types import SimpleNamespace
+
+from ui.recording_detail_screen import RecordingDetailScreen
+
+
+def _screen():
+    calls = []
+    screen = SimpleNamespace(
+        is_mounted=True,
+        recording_id=7,
+        _set_transcription_status=lambda *args: calls.append(args),
+        _schedule_list_refresh=lambda: calls.append("list_refresh"),
+        _schedule_update=lambda: calls.append("update"),
+    )
+    return screen, calls
+
+
+def _finished_task(coro_factory):
+    async def run():
+        task = asyncio.create_task(coro_factory())
+        with contextlib.suppress(BaseException):
+            await task
+        return task
+
+    return asyncio.run(run())
+
+
+def _cancelled_task():
+    async def run():
+        task = asyncio.create_task(asyncio.sleep(60))
+        await asyncio.sleep(0)
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+        return task
+
+    return asyncio.run(run())
+
+
+def test_speaker_identification_success_updates_status():
+    async def identify():
+        return {"success": True, "mappings": [{"speaker_id": "Speaker 0"}]}
+
+    screen, calls = _screen()
+    RecordingDetailScreen._on_speaker_identification_done(
+        screen, _finished_task(identify)
+    )
+
+    assert calls == [("Ready", "speakers identified"), "list_refresh", "update"]
+
+
+def test_speaker_identification_failure_clears_note():
+    async def identify():
+        raise RuntimeError("LLM unavailable")
+
+    screen, calls = _screen()
+    RecordingDetailScreen._on_speaker_identification_done(
+        screen, _finished_task(identify)
+    )
+
+    assert calls == [("Ready",)]
+
+
+def test_cancelled_speaker_identification_is_ignored():
+    screen, calls = _screen()
+    RecordingDetailScreen._on_speaker_identification_done(screen, _cancelled_task())
+
+    assert calls == []
@@ -0,0 +1,42 @@
+import os
+
+from services.storage_manager import StorageManager
+
+
+def _write_source(tmp_path, size=256 * 1024):
+    source = tmp_path / "source.wav"
+    source.write_bytes(os.urandom(size))
+    return source
+
+
+def test_copy_file_sync_copies_whole_file(tmp_path):
+    source = _write_source(tmp_path)
+    dest = tmp_path / "dest.wav"
+
+    assert StorageManager()._copy_file_sync(str(source), str(dest))
+
+    assert dest.stat().st_size == source.stat().st_size
+    assert dest.read_bytes() == source.read_bytes()
+
+
+def test_copy_file_sync_falls_back_when_copy_file_range_stops_early(
+    tmp_path, monkeypatch
+):
+    source = _write_source(tmp_path)
+    dest = tmp_path / "dest.wav"
+    calls = []
+
+    def short_copy_file_range(src, dst, count, *args):
+        # Copy a single small chunk, then report EOF as a short read would
+        if calls:
+            return 0
+        calls.append(count)
+        return os.write(dst, os.read(src, 4096))
+
+    monkeypatch.setattr(os, "copy_file_range", short_copy_file_range, raising=False)
+
+    assert StorageManager()._copy_file_sync(str(source), str(dest))
+
+    assert calls
+    assert dest.stat().st_size == source.stat().st_size
+    assert dest.read_bytes() == source.read_bytes()
@@ -0,0 +1,81 @@
+import asyncio
+from types import SimpleNamespace
+
+from services import transcription_service
+from services.transcription_service import TranscriptionService
+
+TRANSCRIPT = "Speaker 0: Hi, I'm Ada."
+USERS = [{"id": 1, "first_name": "Ada", "last_name": "Lovelace", "role": None}]
+
+
+def test_transcribe_recording_identifies_speakers_in_background(monkeypatch):
+    saved = {}
+    release_identification = None
+
+    async def fake_transcribe_from_file(path):
+        return {"success": True, "transcript": TRANSCRIPT}
+
+    async def fake_update_recording(recording_id, **kwargs):
+        saved[recording_id] = kwargs
+        return True
+
+    async def fake_get_users():
+        return USERS
+
+    async def fake_identify_speakers(transcript, recording_id, users_task=None):
+        users = await users_task
+        await release_identification.wait()
+        return {
+            "success": True,
+            "mappings": [{"speaker_id": "Speaker 0", "user_id": users[0]["id"]}],
+        }
+
+    monkeypatch.setattr(
+        transcription_service, "transcribe_from_file", fake_transcribe_from_file
+    )
+    monkeypatch.setattr(
+        transcription_service, "_get_users_for_identification", fake_get_users
+    )
+    monkeypatch.setattr(
+        transcription_service.RecordingService,
+        "update_recording",
+        staticmethod(fake_update_recording),
+    )
+    monkeypatch.setattr(
+        TranscriptionService,
+        "_identify_speakers",
+        staticmethod(fake_identify_speakers),
+    )
+
+    async def run():
+        nonlocal release_identification
+        release_identification = asyncio.Event()
+        recording = SimpleNamespace(id=7, audio_url=None)
+
+        result = await TranscriptionService.transcribe_recording(
+            recording, {"type": "local", "path": "/recordings/7.m4a"}
+        )
+
+        # The transcript is saved and returned before speakers are identified
+        assert result["success"]
+        assert result["transcript"] == TRANSCRIPT
+        assert result["speaker_mappings"] == []
+        assert saved == {7: {"transcript": TRANSCRIPT}}
+
+        speaker_task = result["speaker_task"]
+        assert not speaker_task.done()
+        assert speaker_task in TranscriptionService._background_tasks
+
+        release_identification.set()
+        speaker_result = await speaker_task
+        await asyncio.sleep(0)
+
+        assert speaker_task not in TranscriptionService._background_tasks
+        return speaker_result
+
+    speaker_result = asyncio.run(run())
+
+    assert speaker_result == {
+        "success": True,
+        "mappings": [{"speaker_id": "Speaker 0", "user_id": 1}],
+    }
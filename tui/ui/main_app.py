@@ -1,23 +1,61 @@
+import asyncio
+import queue
+from typing import Optional
+
 from textual.app import App, ComposeResult
 from textual.containers import Container
 from textual.widgets import Header, Static, Footer
 import logging
+import logging.handlers
 
 from db.connection import init_database, close_database
 from ui.recorder_widget import RecorderWidget
 from ui.recordings_list_widget import RecordingsListWidget
 from components.import_modal import ImportRecordingModal
+from services.azure_storage import close_azure_storage
 from services.import_service import RecordingImporter
 
-# Set up logging (file only to avoid cluttering TUI)
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler("tui_debug.log")],
-)
+REFRESH_DEBOUNCE_SECONDS = 0.1
+
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def configure_logging() -> None:
+    """Set up logging (file only to avoid cluttering TUI)
+
+    Records are handed to a queue and written to disk by a background
+    listener thread, so logging never blocks the event loop on file I/O.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    file_handler = logging.FileHandler("tui_debug.log")
+    file_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logging.basicConfig(
+        level=logging.INFO,
+        handlers=[logging.handlers.QueueHandler(log_queue)],
+    )
+
+    _log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+    _log_listener.start()
 
-# Disable tortoise db_client debug logs
-logging.getLogger("tortoise.db_client").setLevel(logging.INFO)
+    # Disable tortoise db_client debug logs
+    logging.getLogger("tortoise.db_client").setLevel(logging.INFO)
+
+
+def stop_logging() -> None:
+    """Flush queued log records and stop the listener thread"""
+    global _log_listener
+    if _log_listener is None:
+        return
+
+    _log_listener.stop()
+    _log_listener = None
 
 
 class RecordingApp(App):
@@ -68,12 +106,16 @@ class RecordingApp(App):
         self.recorder_widget = RecorderWidget()
         self.recordings_list_widget = RecordingsListWidget()
         self.recording_importer = RecordingImporter()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refresh_pending = False
+        self._message_widget: Optional[Static] = None
+        self._db_task: Optional[asyncio.Task] = None
 
     async def on_mount(self) -> None:
         """Initialize the application"""
-        # Try to connect to database
-        self.db_connected = await init_database()
-        self.recordings_list_widget.set_db_connected(self.db_connected)
+        # Connect to the database in the background so the first frame isn't
+        # held back by the connection handshake
+        self._db_task = asyncio.create_task(init_database())
 
     def compose(self) -> ComposeResult:
         """Create the UI layout"""
@@ -82,7 +124,8 @@ class RecordingApp(App):
         with Container():
             yield Static("", id="spacer")  # Add spacer to push content down
             yield self.recorder_widget
-            yield Static("", id="app-message")
+            self._message_widget = Static("", id="app-message")
+            yield self._message_widget
 
             yield self.recordings_list_widget
 
@@ -90,9 +133,12 @@ class RecordingApp(App):
 
     async def on_ready(self) -> None:
         """Setup after UI is ready"""
-        # Load recordings after UI is ready
+        self.db_connected = await self._db_task
+        self.recordings_list_widget.set_db_connected(self.db_connected)
+
+        # Load recordings in the background so the UI is interactive meanwhile
         if self.db_connected:
-            await self.recordings_list_widget.refresh_recordings_list()
+            self.schedule_refresh()
 
     async def action_start_recording(self) -> None:
         """Start recording"""
@@ -105,12 +151,28 @@ class RecordingApp(App):
         success = await self.recorder_widget.stop_recording()
         # Refresh recordings list if stopped successfully
         if success and self.db_connected:
-            await self.recordings_list_widget.refresh_recordings_list()
+            self.schedule_refresh()
 
     async def action_refresh_list(self) -> None:
         """Refresh recordings list"""
         if self.db_connected:
-            await self.recordings_list_widget.refresh_recordings_list()
+            self.schedule_refresh()
+
+    def schedule_refresh(self) -> None:
+        """Coalesce bursts of refresh requests into a single list reload"""
+        self._refresh_pending = True
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._run_scheduled_refresh())
+
+    async def _run_scheduled_refresh(self) -> None:
+        # Requests that arrive while a refresh is running trigger one more pass
+        while self._refresh_pending:
+            await asyncio.sleep(REFRESH_DEBOUNCE_SECONDS)
+            self._refresh_pending = False
+            try:
+                await self.recordings_list_widget.refresh_recordings_list()
+            except Exception as e:
+                logging.error(f"Error refreshing recordings list: {e}")
 
     async def action_import_recording(self) -> None:
         """Import an existing local audio file"""
@@ -127,17 +189,18 @@ class RecordingApp(App):
         self._set_status_message("Importing...", error=False)
         import_result = await self.recording_importer.import_file(result["path"])
 
-        if import_result.get("success"):
+        if import_result.get("duplicate"):
+            self._set_status_message("Already imported", error=False)
+        elif import_result.get("success"):
             self._set_status_message("Import complete", error=False)
-            await self.recordings_list_widget.refresh_recordings_list()
+            self.schedule_refresh()
         else:
             message = import_result.get("error", "Unknown error")
             self._set_status_message(f"Import failed: {message}", error=True)
 
     def _set_status_message(self, message: str, *, error: bool = False) -> None:
-        try:
-            widget = self.query_one("#app-message", Static)
-        except Exception:
+        widget = self._message_widget
+        if widget is None:
             return
 
         widget.update(message)
@@ -148,10 +211,18 @@ class RecordingApp(App):
         if self.recorder_widget.get_recording_status():
             await self.recorder_widget.stop_recording()
 
+        close_azure_storage()
+
+        if self._db_task is not None and not self._db_task.done():
+            self._db_task.cancel()
+
         if self.db_connected:
             await close_database()
 
+        stop_logging()
+
 
 if __name__ == "__main__":
+    configure_logging()
     app = RecordingApp()
     app.run()
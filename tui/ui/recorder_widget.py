@@ -1,8 +1,10 @@
 from textual.widgets import Static, Input
 from textual.containers import Vertical
 from textual.reactive import reactive
+from textual.timer import Timer
 import asyncio
 import logging
+from typing import Optional
 from recording.recorder import AudioRecorder
 
 
@@ -38,31 +40,42 @@ class RecorderWidget(Vertical):
         """React to changes in recording state"""
         self.update_recording_status()
         if new_value:
-            # Add duration display when recording starts
-            self.mount(Static("⏱️ Duration: 00:00", id="duration-display"))
+            # Show duration display and tick it only while recording
+            if self._duration_widget is not None:
+                self._duration_widget.update("⏱️ Duration: 00:00")
+                self._duration_widget.display = True
+            self._timer = self.set_interval(1.0, self.update_recording_timer)
         else:
-            # Remove duration display when recording stops
-            try:
-                duration_widget = self.query_one("#duration-display", Static)
-                duration_widget.remove()
-            except:
-                pass  # Widget might not exist
+            if self._timer is not None:
+                self._timer.stop()
+                self._timer = None
+            # Hide duration display when recording stops
+            if self._duration_widget is not None:
+                self._duration_widget.display = False
     
     def __init__(self):
         super().__init__()
         self.recorder = AudioRecorder()
+        self._timer: Optional[Timer] = None
+        self._duration_widget: Optional[Static] = None
+        self._status_widget: Optional[Static] = None
+        self._record_task: Optional[asyncio.Task] = None
+        self._stop_requested = False
         
     def compose(self):
         """Create recorder UI components"""
-        yield Static("🎤 RECORDER STATUS - Ready", id="recording-status", classes="recording-status status-ready")
-    
-    def on_mount(self):
-        """Start the recording timer"""
-        self.set_interval(1.0, self.update_recording_timer)
+        self._status_widget = Static("🎤 RECORDER STATUS - Ready", id="recording-status", classes="recording-status status-ready")
+        yield self._status_widget
+        # Mounted once and toggled, to avoid a layout pass per recording
+        self._duration_widget = Static("⏱️ Duration: 00:00", id="duration-display")
+        self._duration_widget.display = False
+        yield self._duration_widget
     
     def update_recording_status(self):
         """Update recording status display"""
-        status_widget = self.query_one("#recording-status", Static)
+        status_widget = self._status_widget
+        if status_widget is None:
+            return
         if self.is_recording:
             status_widget.update("🔴 Recording...")
             status_widget.remove_class("status-ready")
@@ -74,16 +87,9 @@ class RecorderWidget(Vertical):
     
     def update_recording_timer(self):
         """Update recording duration display"""
-        if self.recorder.is_recording():
-            try:
-                duration_widget = self.query_one("#duration-display", Static)
-                duration = self.recorder.get_recording_duration()
-                minutes = int(duration // 60)
-                seconds = int(duration % 60)
-                duration_text = f"{minutes:02d}:{seconds:02d}"
-                duration_widget.update(f"⏱️ Duration: {duration_text}")
-            except:
-                pass  # Duration widget might not exist yet
+        if self.recorder.is_recording() and self._duration_widget is not None:
+            minutes, seconds = divmod(int(self.recorder.get_recording_duration()), 60)
+            self._duration_widget.update(f"⏱️ Duration: {minutes:02d}:{seconds:02d}")
     
     async def start_recording(self):
         """Start recording"""
@@ -103,10 +109,10 @@ class RecorderWidget(Vertical):
             
             if recording_id:
                 self.is_recording = True
-                self.update_recording_status()
                 
-                # Start recording loop
-                asyncio.create_task(self.recording_loop())
+                # Start recording loop on a worker thread
+                self._stop_requested = False
+                self._record_task = asyncio.create_task(self.recording_loop())
                 return recording_id
             else:
                 logging.error("Failed to start recording - no recording ID returned")
@@ -115,9 +121,9 @@ class RecorderWidget(Vertical):
         except Exception as e:
             logging.error(f"Error starting recording: {e}", exc_info=True)
             # Show error in status
-            status_widget = self.query_one("#recording-status", Static)
-            status_widget.update(f"ERROR: {str(e)}")
-            status_widget.styles.background = "red 100%"
+            if self._status_widget is not None:
+                self._status_widget.update(f"ERROR: {str(e)}")
+                self._status_widget.styles.background = "red 100%"
             return None
     
     async def stop_recording(self):
@@ -125,18 +131,28 @@ class RecorderWidget(Vertical):
         if not self.is_recording:
             return False
         
+        # Let the reader thread finish its current chunk before the stream closes
+        self._stop_requested = True
+        record_task = self._record_task
+        self._record_task = None
+        if record_task is not None and record_task is not asyncio.current_task():
+            await record_task
+        
         success = await self.recorder.stop_recording()
         self.is_recording = False
-        self.update_recording_status()
         return success
     
     async def recording_loop(self):
         """Main recording loop"""
-        while self.recorder.is_recording():
+        if not await asyncio.to_thread(self._record_blocking):
+            await self.stop_recording()
+    
+    def _record_blocking(self) -> bool:
+        """Read chunks until stopped; the blocking stream read paces the loop"""
+        while self.recorder.is_recording() and not self._stop_requested:
             if not self.recorder.record_chunk():
-                await self.stop_recording()
-                break
-            await asyncio.sleep(0.01)  # Small delay to prevent blocking
+                return False
+        return True
     
     def get_recording_status(self):
         """Get current recording status"""
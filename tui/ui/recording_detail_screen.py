@@ -1,14 +1,18 @@
 import asyncio
+import contextlib
+import functools
 import logging
 import shutil
 import subprocess
 import sys
-from typing import Dict, List, Optional
+import time
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
 from textual.app import ComposeResult
+from textual.binding import Binding
 from textual.containers import Container, Vertical
-from textual.css.query import NoMatches
 from textual.reactive import reactive
+from textual.app import ScreenStackError
 from textual.screen import Screen
 from textual.widgets import Footer, Header, Static, TextArea
 
@@ -20,11 +24,41 @@ from db.service import (
     UserService,
 )
 from services.analysis_service import analyze_transcript
-from services.storage_manager import StorageManager
+from services.storage_manager import get_storage_manager
 from services.transcription_service import TranscriptionService
 from components.analysis_modal import AnalysisModal
 from components.rename_modal import RenameModal
 
+# Longer texts are shown a screenful first and the rest appended in batches
+TEXT_STREAM_THRESHOLD = 8192
+TEXT_STREAM_CHUNK_SIZE = 16384
+USER_NAMES_TTL = 30.0
+
+
+def _log_errors(verb: str):
+    """Log and swallow exceptions raised by a recording action"""
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                return await fn(self, *args, **kwargs)
+            except Exception as e:
+                logging.error("Error %s recording %s: %s", verb, self.recording_id, e)
+
+        return wrapper
+
+    return decorator
+
+
+def _format_todo(todo: Dict, first_names: Dict[int, str]) -> str:
+    """Render one TODO as a bullet with its assignee and description"""
+    first_name = first_names.get(todo.get("user_id"))
+    user_note = f" (@{first_name})" if first_name else ""
+    if todo.get("desc"):
+        return f"• {todo['name']}{user_note}\n  {todo['desc']}"
+    return f"• {todo['name']}{user_note}"
+
 
 class RecordingDetailScreen(Screen):
     """Screen for displaying recording details"""
@@ -99,74 +133,161 @@ class RecordingDetailScreen(Screen):
         ("y", "copy_active_view", "Copy active analysis text"),
         ("down", "view_next", "Next output view"),
         ("up", "view_prev", "Previous output view"),
-        # Override main app bindings to disable them
+        # Override main app bindings to disable them. inherit_bindings only
+        # drops bindings from base classes; app bindings still apply here.
         ("r", "rename", "Rename the recording"),
-        ("s", "ignore", ""),
-        ("f", "ignore", ""),
+        Binding("s", "ignore", "", show=False),
+        Binding("f", "ignore", "", show=False),
     ]
 
+    # Strong references to work that outlives the screen it was started from
+    _detached_tasks: Set[asyncio.Task] = set()
+
     def __init__(self, recording_id: int):
         super().__init__()
         self.recording_id = recording_id
         self.recording = None
-        self.storage_manager = StorageManager()
+        # Start loading right away so the query overlaps with compose
+        self._load_task: asyncio.Task = asyncio.create_task(
+            RecordingService.get_recording_by_id(recording_id)
+        )
+        self.storage_manager = get_storage_manager()
         self._transcription_task: Optional[asyncio.Task] = None
         self._analysis_task: Optional[asyncio.Task] = None
         self._storage_tasks: Dict[str, asyncio.Task] = {}
-        self._available_views: List[str] = ["transcript"]
-        self._transcript_text = "No transcript available."
-        self._summary_text = "No summary available."
-        self._todos_text = "No TODOs available."
+        # Fire-and-forget UI refreshes, held so they are not collected mid-run
+        self._bg_tasks: Set[asyncio.Task] = set()
+        self._update_task: Optional[asyncio.Task] = None
+        self._update_pending = False
+        # Serializes changes to the recording; extra key presses are dropped
+        self._mutation_lock = asyncio.Lock()
+        # Ordered for cycling, plus a set for membership checks
+        self._available_views: Tuple[str, ...] = ("transcript",)
+        self._available_view_set: FrozenSet[str] = frozenset(self._available_views)
+        self._view_texts: Dict[str, str] = {
+            "transcript": "No transcript available.",
+            "summary": "No summary available.",
+            "todos": "No TODOs available.",
+        }
         self._transcription_status_text = "Transcription: Not started"
         self._transcription_status_note: Optional[str] = None
         self._analysis_status_text = "Analysis: Loading..."
         self._analysis_status_note: Optional[str] = None
+        self._main_container: Optional[Vertical] = None
+        self._title_widget: Optional[Static] = None
+        self._date_widget: Optional[Static] = None
+        self._storage_widget: Optional[Static] = None
+        self._transcription_status_widget: Optional[Static] = None
+        self._analysis_status_widget: Optional[Static] = None
+        self._view_label_widget: Optional[Static] = None
+        self._text_widget: Optional[TextArea] = None
+        self._storage_label: Optional[str] = None
+        self._date_label: Optional[str] = None
+        self._displayed_storage_label: Optional[str] = None
+        self._user_first_names: Optional[Dict[int, str]] = None
+        self._user_first_names_loaded_at = 0.0
+        # Set whenever self.recording changes; cleared once it is displayed
+        self._dirty = True
+        self._displayed_text = "No transcript available."
+        self._displayed_label = self.VIEW_LABELS["transcript"]
+        self._rename_modal: Optional[RenameModal] = None
+        self._analysis_modal: Optional[AnalysisModal] = None
 
     async def on_mount(self):
         """Load recording data when screen mounts"""
         try:
-            self.recording = await RecordingService.get_recording_by_id(
-                self.recording_id
-            )
+            self.recording = await self._load_task
         except Exception as e:
-            logging.error(f"Error loading recording {self.recording_id}: {e}")
+            logging.error("Error loading recording %s: %s", self.recording_id, e)
+
+        self._text_widget.can_focus = False
+
+    async def on_unmount(self):
+        """Stop pending work and release the modals kept installed for reuse"""
+        # The initial load only feeds this screen, so stop it outright
+        if not self._load_task.done():
+            self._load_task.cancel()
+            await asyncio.gather(self._load_task, return_exceptions=True)
+
+        # Pending display refreshes are pointless once the screen is gone
+        pending = [task for task in self._bg_tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._bg_tasks.clear()
+
+        # Transcription, analysis and storage changes are left to finish so
+        # their results are saved; their callbacks skip UI work once unmounted
+        work = [self._transcription_task, self._analysis_task, *self._storage_tasks.values()]
+        for task in work:
+            if task is not None and not task.done():
+                RecordingDetailScreen._detached_tasks.add(task)
+                task.add_done_callback(RecordingDetailScreen._detached_tasks.discard)
+        self._transcription_task = None
+        self._analysis_task = None
+        self._storage_tasks.clear()
 
-        analysis_text = self.query_one("#analysis-text", TextArea)
-        analysis_text.can_focus = False
+        for modal in (self._rename_modal, self._analysis_modal):
+            if modal is None:
+                continue
+            # uninstall_screen refuses a modal that is still on the stack
+            with contextlib.suppress(ScreenStackError):
+                self.app.uninstall_screen(modal)
+                await modal.remove()
+        self._rename_modal = None
+        self._analysis_modal = None
 
     def compose(self) -> ComposeResult:
         """Create the UI layout"""
         yield Header(show_clock=False)
 
-        with Vertical(classes="detail-container", id="main-container"):
+        # Keep references to the widgets we update so handlers skip DOM queries
+        self._main_container = Vertical(classes="detail-container", id="main-container")
+        with self._main_container:
             # Title and date section
             with Container(classes="title-section"):
-                yield Static(
+                self._title_widget = Static(
                     "Loading...", id="recording-title", classes="recording-title"
                 )
-                yield Static("", id="recording-date", classes="recording-date")
-                yield Static("", id="storage-status", classes="recording-date")
-                yield Static("", id="transcription-status", classes="recording-date")
-                yield Static("", id="analysis-status", classes="recording-date")
+                yield self._title_widget
+                self._date_widget = Static("", id="recording-date", classes="recording-date")
+                yield self._date_widget
+                self._storage_widget = Static(
+                    "", id="storage-status", classes="recording-date"
+                )
+                yield self._storage_widget
+                self._transcription_status_widget = Static(
+                    "", id="transcription-status", classes="recording-date"
+                )
+                yield self._transcription_status_widget
+                self._analysis_status_widget = Static(
+                    "", id="analysis-status", classes="recording-date"
+                )
+                yield self._analysis_status_widget
 
             with Container(id="content-wrapper", classes="content-container"):
                 with Container(classes="analysis-wrapper"):
-                    yield Static("Transcript", id="view-label", classes="view-label")
-                    yield TextArea(
+                    self._view_label_widget = Static(
+                        "Transcript", id="view-label", classes="view-label"
+                    )
+                    yield self._view_label_widget
+                    self._text_widget = TextArea(
                         "No transcript available.",
                         id="analysis-text",
                         classes="analysis-text",
                         read_only=True,
                     )
+                    yield self._text_widget
 
         yield Footer()
 
     async def on_screen_resume(self):
         """Update display when screen becomes active"""
-        if self.recording:
+        # Returning from a modal usually changes nothing worth redrawing
+        if self.recording and self._dirty:
             await self.update_display()
         # Focus the main container so it can receive key events
-        main_container = self.query_one("#main-container")
+        main_container = self._main_container
         main_container.can_focus = True
         main_container.focus()
 
@@ -175,42 +296,50 @@ class RecordingDetailScreen(Screen):
         if not self.recording or not self.is_mounted:
             return
 
-        try:
-            title_widget = self.query_one("#recording-title", Static)
-            date_widget = self.query_one("#recording-date", Static)
-            storage_widget = self.query_one("#storage-status", Static)
-            text_widget = self.query_one("#analysis-text", TextArea)
-        except NoMatches:
-            return
+        # Cleared up front so changes made while this awaits are not lost
+        self._dirty = False
 
-        title_widget.update(self.recording.name)
-        date_widget.update(f"Created: {self.recording.created_at_formatted}")
-        storage_widget.update(f"Storage: {self.recording.storage_status_readable}")
-
-        output_status = await AnalysisService.get_output_status(self.recording)
+        self._title_widget.update(self.recording.name)
+        # created_at never changes, so format and show it only once
+        if self._date_label is None:
+            self._date_label = f"Created: {self.recording.created_at_formatted}"
+            self._date_widget.update(self._date_label)
+        # Only the transcript flag of the output status is shown, and that is
+        # already on the recording
         self._transcription_status_text = (
             "Transcription: Ready"
-            if output_status["transcript"]
+            if self.recording.transcript
             else "Transcription: Missing"
         )
         self._transcription_status_note = None
         self._render_transcription_status()
 
+        # The storage check, analysis status and TODOs are independent lookups
+        storage_label, analysis_status, (todos_text, todos_available) = (
+            await asyncio.gather(
+                self._get_storage_label(),
+                self._get_analysis_status(),
+                self._build_todos_text(),
+            )
+        )
+        if storage_label != self._displayed_storage_label:
+            self._storage_widget.update(storage_label)
+            self._displayed_storage_label = storage_label
+
         # Update analysis status - always show even if no analyses completed
-        analysis_status = await AnalysisService.get_analysis_status(self.recording)
         self._analysis_status_text = f"Analysis: {analysis_status}"
         self._analysis_status_note = None
         self._render_analysis_status()
         logging.debug(
-            f"Analysis status for recording {self.recording_id}: '{analysis_status}'"
+            "Analysis status for recording %s: '%s'", self.recording_id, analysis_status
         )
 
-        self._transcript_text = self.recording.transcript or "No transcript available."
+        self._view_texts["transcript"] = (
+            self.recording.transcript or "No transcript available."
+        )
         summary_present = bool(self.recording.summary)
-        self._summary_text = self.recording.summary or "No summary available."
-
-        todos_text, todos_available = await self._build_todos_text()
-        self._todos_text = todos_text
+        self._view_texts["summary"] = self.recording.summary or "No summary available."
+        self._view_texts["todos"] = todos_text
 
         available_views: List[str] = ["transcript"]
         if summary_present:
@@ -220,18 +349,21 @@ class RecordingDetailScreen(Screen):
 
         self._set_available_views(available_views)
 
-        label_widget = self.query_one("#view-label", Static)
-
-        if not self.is_mounted:
-            if self.active_view == "summary" and summary_present:
-                text_widget.text = self._summary_text
-                label_widget.update(self.VIEW_LABELS["summary"])
-            elif self.active_view == "todos" and todos_available:
-                text_widget.text = self._todos_text
-                label_widget.update(self.VIEW_LABELS["todos"])
-            else:
-                text_widget.text = self._transcript_text
-                label_widget.update(self.VIEW_LABELS["transcript"])
+    async def _get_analysis_status(self) -> str:
+        # Nothing can have been analysed before there is a transcript
+        if not self.recording.transcript:
+            return "(no transcript)"
+        return await AnalysisService.get_analysis_status(self.recording)
+
+    async def _get_storage_label(self) -> str:
+        # Checking the local/NAS paths stats the filesystem, so only redo it
+        # after a storage toggle
+        if self._storage_label is None:
+            readable = await asyncio.to_thread(
+                getattr, self.recording, "storage_status_readable"
+            )
+            self._storage_label = f"Storage: {readable}"
+        return self._storage_label
 
     def watch_active_view(self, old_view: str, new_view: str) -> None:
         if not self.is_mounted:
@@ -241,8 +373,9 @@ class RecordingDetailScreen(Screen):
     def _set_available_views(self, views: List[str]) -> None:
         if not views:
             views = ["transcript"]
-        self._available_views = views
-        if self.active_view not in views:
+        self._available_views = tuple(views)
+        self._available_view_set = frozenset(views)
+        if self.active_view not in self._available_view_set:
             self.active_view = views[0]
         elif self.is_mounted:
             self._refresh_active_view()
@@ -261,40 +394,54 @@ class RecordingDetailScreen(Screen):
 
     def _refresh_active_view(self) -> None:
         self._set_analysis_status_note(None)
-        if not self._available_views:
-            text_widget = self.query_one("#analysis-text", TextArea)
-            label_widget = self.query_one("#view-label", Static)
-            text_widget.text = self._transcript_text
-            label_widget.update(self.VIEW_LABELS["transcript"])
-            return
-
-        if self.active_view not in self._available_views and self._available_views:
+        if self._available_views and self.active_view not in self._available_view_set:
             self.active_view = self._available_views[0]
             return
 
-        text_widget = self.query_one("#analysis-text", TextArea)
-        label_widget = self.query_one("#view-label", Static)
-        if self.active_view == "summary":
-            text_widget.text = self._summary_text
-            label_widget.update(self.VIEW_LABELS["summary"])
-        elif self.active_view == "todos":
-            text_widget.text = self._todos_text
-            label_widget.update(self.VIEW_LABELS["todos"])
-        else:
-            text_widget.text = self._transcript_text
-            label_widget.update(self.VIEW_LABELS["transcript"])
+        view = self.active_view if self._available_views else "transcript"
+        labels = self.VIEW_LABELS
+        label = labels.get(view, labels["transcript"])
+        self._show_text(self._get_view_text(view), label)
+
+    def _show_text(self, text: str, label: str) -> None:
+        # Assigning TextArea.text rebuilds the document even for identical text
+        if text is not self._displayed_text and text != self._displayed_text:
+            self._displayed_text = text
+            if len(text) > TEXT_STREAM_THRESHOLD:
+                self._text_widget.text = text[:TEXT_STREAM_THRESHOLD]
+                self.run_worker(
+                    self._append_remaining_text(text),
+                    group="text-stream",
+                    exclusive=True,
+                )
+            else:
+                self._text_widget.text = text
+        if label != self._displayed_label:
+            self._view_label_widget.update(label)
+            self._displayed_label = label
+
+    async def _append_remaining_text(self, text: str) -> None:
+        """Append the rest of a long text without stalling the event loop"""
+        text_widget = self._text_widget
+        for start in range(TEXT_STREAM_THRESHOLD, len(text), TEXT_STREAM_CHUNK_SIZE):
+            await asyncio.sleep(0)
+            # Stop if another view replaced the text meanwhile
+            if self._displayed_text is not text:
+                return
+            text_widget.insert(
+                text[start : start + TEXT_STREAM_CHUNK_SIZE],
+                text_widget.document.end,
+            )
+
+    def _get_view_text(self, view: str) -> str:
+        return self._view_texts.get(view, self._view_texts["transcript"])
 
     def _get_active_view_text(self) -> str:
-        if self.active_view == "summary":
-            return self._summary_text
-        if self.active_view == "todos":
-            return self._todos_text
-        return self._transcript_text
+        return self._get_view_text(self.active_view)
 
     def _render_analysis_status(self) -> None:
-        try:
-            widget = self.query_one("#analysis-status", Static)
-        except Exception:
+        widget = self._analysis_status_widget
+        if widget is None:
             return
         if self._analysis_status_note:
             widget.update(
@@ -304,9 +451,8 @@ class RecordingDetailScreen(Screen):
             widget.update(self._analysis_status_text)
 
     def _render_transcription_status(self) -> None:
-        try:
-            widget = self.query_one("#transcription-status", Static)
-        except Exception:
+        widget = self._transcription_status_widget
+        if widget is None:
             return
         if self._transcription_status_note:
             widget.update(
@@ -331,91 +477,119 @@ class RecordingDetailScreen(Screen):
         self._analysis_status_note = note
         self._render_analysis_status()
 
+    def _schedule_update(self) -> None:
+        """Coalesce refreshes requested by finishing tasks into one pass"""
+        # While a modal or another screen covers this one, just remember to
+        # redraw; on_screen_resume picks it up
+        self._dirty = True
+        if not self.is_current:
+            return
+        self._update_pending = True
+        if self._update_task is None or self._update_task.done():
+            self._update_task = self._spawn(self._run_scheduled_update())
+
+    async def _run_scheduled_update(self) -> None:
+        # Requests that arrive while a refresh is running trigger one more pass
+        while self._update_pending:
+            self._update_pending = False
+            try:
+                await self.update_display()
+            except Exception as e:
+                logging.error("Error refreshing recording %s: %s", self.recording_id, e)
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
+
     def _schedule_list_refresh(self) -> None:
-        recordings_list = getattr(self.app, "recordings_list_widget", None)
-        if recordings_list is None:
-            return
-        self.run_worker(recordings_list.refresh_recordings_list(), exclusive=False)
+        self.app.schedule_refresh()
 
     async def _build_todos_text(self) -> tuple[str, bool]:
-        if not self.recording:
+        # TODOs are extracted from the transcript, so none can exist without one
+        if not self.recording or not self.recording.transcript:
             return "No TODOs available.", False
 
-        todos = await TodoService.get_todos_by_recording(self.recording_id)
+        # The assignee names are cached per screen, so fetching them alongside
+        # the TODOs costs at most one overlapping query
+        todos, first_names = await asyncio.gather(
+            TodoService.get_todos_by_recording(self.recording_id),
+            self._get_user_first_names(),
+        )
         if not todos:
             return "No TODOs available.", False
 
-        users = await UserService.get_all_users()
-        user_map = {user.id: user for user in users}
-
-        lines: List[str] = []
-        for todo in todos:
-            user_note = ""
-            user_id = todo.get("user_id")
-            if user_id is not None:
-                user = user_map.get(user_id)
-                if user:
-                    user_note = f" (@{user.first_name})"
-
-            lines.append(f"• {todo['name']}{user_note}")
-            if todo.get("desc"):
-                lines.append(f"  {todo['desc']}")
-            lines.append("")
+        return "\n\n".join(_format_todo(todo, first_names) for todo in todos), True
 
-        if lines and lines[-1] == "":
-            lines.pop()
-
-        return "\n".join(lines), True
+    async def _get_user_first_names(self) -> Dict[int, str]:
+        """Map user ids to first names, reusing the lookup for a short while"""
+        now = time.monotonic()
+        if (
+            self._user_first_names is None
+            or now - self._user_first_names_loaded_at > USER_NAMES_TTL
+        ):
+            users = await UserService.get_all_user_dicts()
+            self._user_first_names = {user["id"]: user["first_name"] for user in users}
+            self._user_first_names_loaded_at = now
+        return self._user_first_names
 
     def action_back(self):
         """Go back to the main screen"""
         self.app.pop_screen()
 
+    @_log_errors("deleting")
     async def action_delete_recording(self):
         """Delete the recording"""
         if self.recording:
-            try:
-                await RecordingService.delete_recording(self.recording_id)
-                logging.info(f"Deleted recording {self.recording_id}")
-                self._schedule_list_refresh()
-                self.app.pop_screen()
-            except Exception as e:
-                logging.error(f"Error deleting recording {self.recording_id}: {e}")
+            await RecordingService.delete_recording(self.recording_id)
+            logging.info("Deleted recording %s", self.recording_id)
+            self._schedule_list_refresh()
+            self.app.pop_screen()
 
+    @_log_errors("archiving")
     async def action_archive_recording(self):
         """Archive the recording"""
-        if self.recording:
-            try:
+        if self.recording and not self._mutation_busy():
+            async with self._mutation_lock:
                 await RecordingService.archive_recording(self.recording_id)
-                logging.info(f"Archived recording {self.recording_id}")
+                logging.info("Archived recording %s", self.recording_id)
                 # Update the recording object to reflect the change
                 self.recording.archived = True
-                self._schedule_list_refresh()
-                await self.update_display()
-            except Exception as e:
-                logging.error(f"Error archiving recording {self.recording_id}: {e}")
+                self._dirty = True
+            self._schedule_list_refresh()
+            await self.update_display()
 
     def action_rename(self):
         """Start renaming the recording"""
         if self.recording:
             current_name = self.recording.name
-            modal = RenameModal(current_name)
+            modal = self._rename_modal
+            if modal is None:
+                # Installed so popping it keeps its widget tree for the next rename
+                modal = RenameModal(current_name)
+                self.app.install_screen(modal, name=f"rename-{id(self)}")
+                self._rename_modal = modal
+            else:
+                modal.current_name = current_name
             self.app.push_screen(modal, callback=self.handle_rename_result)
 
+    @_log_errors("renaming")
     async def handle_rename_result(self, new_name):
         """Handle the result from the rename modal"""
         if new_name and self.recording and new_name != self.recording.name:
-            try:
-                # Update the recording name
+            if self._mutation_busy():
+                return
+            # Update the recording name
+            async with self._mutation_lock:
                 await RecordingService.update_recording(
                     self.recording_id, name=new_name
                 )
                 self.recording.name = new_name
-                self._schedule_list_refresh()
-                await self.update_display()
-                logging.info(f"Renamed recording {self.recording_id} to '{new_name}'")
-            except Exception as e:
-                logging.error(f"Error renaming recording {self.recording_id}: {e}")
+            self._schedule_list_refresh()
+            # Only the title changed, so skip the full refresh
+            self._title_widget.update(new_name)
+            logging.info("Renamed recording %s to %r", self.recording_id, new_name)
 
     async def action_transcribe(self):
         """Generate transcription using Deepgram"""
@@ -426,13 +600,14 @@ class RecordingDetailScreen(Screen):
             logging.info("Transcription already in progress for %s", self.recording_id)
             return
 
-        text_widget = self.query_one("#analysis-text", TextArea)
+        # Probe for a source while the status line repaints
+        source_task = asyncio.create_task(
+            self.storage_manager.get_first_available_source(self.recording)
+        )
         self._set_transcription_status("Running", "contacting Deepgram")
 
         try:
-            source_info = await self.storage_manager.get_first_available_source(
-                self.recording
-            )
+            source_info = await source_task
         except Exception as exc:
             logging.error("Error locating audio source: %s", exc)
             self._set_transcription_status("Failed", "audio lookup error")
@@ -442,13 +617,11 @@ class RecordingDetailScreen(Screen):
             self._set_transcription_status("Failed", "no audio source available")
             return
 
-        task = asyncio.create_task(self._run_transcription(source_info, text_widget))
+        task = asyncio.create_task(self._run_transcription(source_info))
         self._transcription_task = task
         task.add_done_callback(self._on_transcription_done)
 
-    async def _run_transcription(
-        self, source_info, text_widget: TextArea
-    ) -> Dict[str, object]:
+    async def _run_transcription(self, source_info) -> Dict[str, object]:
         if not self.recording:
             return {"success": False, "error": "Recording unavailable"}
 
@@ -456,16 +629,14 @@ class RecordingDetailScreen(Screen):
         result = await TranscriptionService.transcribe_recording(recording, source_info)
         if result.get("success"):
             transcript_text = result.get("transcript", "")
-            updated = await RecordingService.get_recording_by_id(self.recording_id)
-            if updated:
-                self.recording = updated
-            else:
-                recording.transcript = transcript_text
-                self.recording = recording
+            # Patch the saved transcript in rather than re-reading the row
+            recording.transcript = transcript_text
+            self.recording = recording
+            self._dirty = True
             display_text = transcript_text or "No transcript available."
-            self._transcript_text = display_text
+            self._view_texts["transcript"] = display_text
             if self.active_view == "transcript":
-                text_widget.text = display_text
+                self._show_text(display_text, self.VIEW_LABELS["transcript"])
         return result
 
     def _on_transcription_done(self, task: asyncio.Task) -> None:
@@ -482,7 +653,12 @@ class RecordingDetailScreen(Screen):
             return
 
         if result.get("success"):
-            if result.get("speaker_identification_success"):
+            speaker_task = result.get("speaker_task")
+            if speaker_task is not None:
+                self._set_transcription_status("Ready", "identifying speakers")
+                speaker_task.add_done_callback(self._on_speaker_identification_done)
+                logging.info("Transcribed recording %s", self.recording_id)
+            elif result.get("speaker_identification_success"):
                 self._set_transcription_status("Ready", "speakers identified")
                 logging.info(
                     "Transcribed recording %s with %d speaker mappings",
@@ -496,7 +672,7 @@ class RecordingDetailScreen(Screen):
                     self.recording_id,
                 )
             self._schedule_list_refresh()
-            asyncio.create_task(self.update_display())
+            self._schedule_update()
         else:
             self._set_transcription_status(
                 "Failed", result.get("error", "Unknown error")
@@ -505,80 +681,76 @@ class RecordingDetailScreen(Screen):
                 "Transcription failed: %s", result.get("error", "Unknown error")
             )
 
-    async def action_toggle_cloud(self):
-        """Toggle cloud storage for recording"""
-        if not self.recording:
+    def _on_speaker_identification_done(self, task: asyncio.Task) -> None:
+        # A cancelled task (e.g. at shutdown) has no result to report
+        if task.cancelled() or not self.is_mounted:
             return
 
-        if self._storage_tasks.get("cloud") and not self._storage_tasks["cloud"].done():
-            logging.info("Cloud toggle already in progress for %s", self.recording_id)
+        try:
+            result = task.result()
+        except Exception as exc:
+            logging.error(
+                "Error identifying speakers for recording %s: %s", self.recording_id, exc
+            )
+            self._set_transcription_status("Ready")
             return
 
-        self._set_analysis_status_note("storage sync running")
+        if result.get("success"):
+            self._set_transcription_status("Ready", "speakers identified")
+            logging.info(
+                "Identified %d speaker mappings for recording %s",
+                len(result.get("mappings", [])),
+                self.recording_id,
+            )
+            self._schedule_list_refresh()
+            self._schedule_update()
+        else:
+            self._set_transcription_status("Ready")
 
-        task = asyncio.create_task(self._toggle_cloud_backend())
-        self._storage_tasks["cloud"] = task
-        task.add_done_callback(
-            lambda t, key="cloud": self._on_storage_toggle_done(key, t)
-        )
+    async def action_toggle_cloud(self):
+        """Toggle cloud storage for recording"""
+        self._start_storage_toggle("cloud", "Cloud")
 
     async def action_toggle_nas(self):
         """Toggle NAS storage for recording"""
-        if not self.recording:
-            return
-
-        if self._storage_tasks.get("nas") and not self._storage_tasks["nas"].done():
-            logging.info("NAS toggle already in progress for %s", self.recording_id)
-            return
-
-        self._set_analysis_status_note("storage sync running")
-
-        task = asyncio.create_task(self._toggle_nas_backend())
-        self._storage_tasks["nas"] = task
-        task.add_done_callback(
-            lambda t, key="nas": self._on_storage_toggle_done(key, t)
-        )
+        self._start_storage_toggle("nas", "NAS")
 
     async def action_toggle_local(self):
         """Toggle local storage for recording"""
+        self._start_storage_toggle("local", "Local")
+
+    def _start_storage_toggle(self, key: str, label: str) -> None:
         if not self.recording:
             return
 
-        if self._storage_tasks.get("local") and not self._storage_tasks["local"].done():
-            logging.info("Local toggle already in progress for %s", self.recording_id)
+        if self._storage_tasks.get(key) and not self._storage_tasks[key].done():
+            logging.info("%s toggle already in progress for %s", label, self.recording_id)
             return
 
         self._set_analysis_status_note("storage sync running")
 
-        task = asyncio.create_task(self._toggle_local_backend())
-        self._storage_tasks["local"] = task
-        task.add_done_callback(
-            lambda t, key="local": self._on_storage_toggle_done(key, t)
-        )
-
-    async def _toggle_cloud_backend(self) -> Dict[str, object]:
-        result = await self.storage_manager.toggle_cloud_storage(self.recording)
-        if result.get("success"):
-            updated = await RecordingService.get_recording_by_id(self.recording_id)
-            if updated:
-                self.recording = updated
-        return result
-
-    async def _toggle_nas_backend(self) -> Dict[str, object]:
-        result = await self.storage_manager.toggle_nas_storage(self.recording)
-        if result.get("success"):
-            updated = await RecordingService.get_recording_by_id(self.recording_id)
-            if updated:
-                self.recording = updated
+        task = asyncio.create_task(self._toggle_storage_backend(key))
+        self._storage_tasks[key] = task
+        task.add_done_callback(lambda t: self._on_storage_toggle_done(key, t))
+
+    async def _toggle_storage_backend(self, key: str) -> Dict[str, object]:
+        if self._mutation_busy():
+            return {"success": False, "error": "Another change is in progress"}
+
+        async with self._mutation_lock:
+            toggle = getattr(self.storage_manager, f"toggle_{key}_storage")
+            result = await toggle(self.recording)
+            if result.get("success"):
+                self.recording = result["recording"]
+                self._dirty = True
+                self._storage_label = None
         return result
 
-    async def _toggle_local_backend(self) -> Dict[str, object]:
-        result = await self.storage_manager.toggle_local_storage(self.recording)
-        if result.get("success"):
-            updated = await RecordingService.get_recording_by_id(self.recording_id)
-            if updated:
-                self.recording = updated
-        return result
+    def _mutation_busy(self) -> bool:
+        if self._mutation_lock.locked():
+            logging.info("Another change is in progress for %s", self.recording_id)
+            return True
+        return False
 
     def _on_storage_toggle_done(self, key: str, task: asyncio.Task) -> None:
         stored_task = self._storage_tasks.get(key)
@@ -599,7 +771,7 @@ class RecordingDetailScreen(Screen):
             action = result.get("action", "updated").title()
             self._set_analysis_status_note(f"{key.upper()} {action.lower()}")
             self._schedule_list_refresh()
-            asyncio.create_task(self.update_display())
+            self._schedule_update()
             logging.info(
                 "%s storage %s for recording %s",
                 key.upper(),
@@ -625,14 +797,18 @@ class RecordingDetailScreen(Screen):
             return
 
         logging.info("Opening analysis modal")
-        modal = AnalysisModal(self.recording.transcript)
+        modal = self._analysis_modal
+        if modal is None:
+            modal = AnalysisModal(self.recording.transcript)
+            self.app.install_screen(modal, name=f"analysis-{id(self)}")
+            self._analysis_modal = modal
+        else:
+            modal.transcript = self.recording.transcript
         self.app.push_screen(modal, callback=self.handle_analysis_result)
 
     async def handle_analysis_result(self, analysis_type):
         """Handle the result from the analysis modal"""
-        logging.info(
-            f"handle_analysis_result called with analysis_type: {analysis_type}"
-        )
+        logging.info("handle_analysis_result called with analysis_type: %s", analysis_type)
 
         if not analysis_type:
             logging.info("No analysis type selected, returning")
@@ -681,9 +857,11 @@ class RecordingDetailScreen(Screen):
         )
 
         if result.get("success"):
-            updated = await RecordingService.get_recording_by_id(self.recording_id)
-            if updated:
-                self.recording = updated
+            # Only a summary lands on the recording row; TODOs are re-read
+            # by update_display
+            if analysis_type == "summary":
+                recording.summary = result.get("content")
+            self._dirty = True
 
         return result
 
@@ -710,7 +888,7 @@ class RecordingDetailScreen(Screen):
                 )
 
             self._schedule_list_refresh()
-            asyncio.create_task(self.update_display())
+            self._schedule_update()
             logging.info(
                 "Analysis '%s' completed for recording %s",
                 analysis_type,
@@ -770,7 +948,7 @@ class RecordingDetailScreen(Screen):
             try:
                 subprocess.run(cmd, input=text, text=True, check=True)
                 return True
-            except Exception:
+            except (OSError, subprocess.SubprocessError):
                 logging.debug("Clipboard command %s failed", cmd[0], exc_info=True)
                 continue
         return False
@@ -1,12 +1,26 @@
 import asyncio
 import logging
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from textual.widgets import DataTable, Static
+from textual.widgets.data_table import ColumnKey
 from textual.containers import Container
 
 from db.service import RecordingService
 
+RECORDINGS_PAGE_SIZE = 100
+
+COLUMNS = (
+    "ID",
+    "Name",
+    "Duration",
+    "Created",
+    "Transcript",
+    "Storage",
+    "Outputs",
+    "Status",
+)
+
 
 class RecordingsListWidget(Container):
     """Widget for displaying and managing recordings list"""
@@ -25,30 +39,33 @@ class RecordingsListWidget(Container):
 
     BINDINGS = [
         ("enter,right", "open_recording", "Open Recording"),
+        ("right_square_bracket", "next_page", "Next page"),
+        ("left_square_bracket", "prev_page", "Previous page"),
     ]
 
     def __init__(self, db_connected: bool = False):
         super().__init__()
         self.db_connected = db_connected
+        self._table: Optional[DataTable] = None
+        self._header: Optional[Static] = None
+        self._page = 0
+        self._has_next_page = False
+        self._last_rows: Optional[List[Tuple[str, ...]]] = None
+        self._column_keys: List[ColumnKey] = []
 
     def compose(self):
         """Create recordings list UI components"""
-        yield Static("Recordings List - Use ↑↓ to navigate", classes="section-header")
-        yield DataTable(id="recordings-table")
+        self._header = Static(
+            "Recordings List - Use ↑↓ to navigate", classes="section-header"
+        )
+        yield self._header
+        self._table = DataTable(id="recordings-table")
+        yield self._table
 
     def on_mount(self):
         """Initialize the table"""
-        table = self.query_one("#recordings-table", DataTable)
-        table.add_columns(
-            "ID",
-            "Name",
-            "Duration",
-            "Created",
-            "Transcript",
-            "Storage",
-            "Outputs",
-            "Status",
-        )
+        table = self._table
+        self._column_keys = table.add_columns(*COLUMNS)
         table.cursor_type = "row"
         table.zebra_stripes = True
         table.focus()
@@ -60,15 +77,15 @@ class RecordingsListWidget(Container):
 
     def get_selected_recording_id(self) -> Optional[int]:
         """Get the ID of the currently selected recording"""
-        table = self.query_one("#recordings-table", DataTable)
-        if table.cursor_row is not None:
-            try:
-                row_key = table.coordinate_to_cell_key(table.cursor_coordinate)
-                row_data = table.get_row(row_key.row_key)
-                return int(row_data[0])  # ID is first column
-            except Exception as e:
-                logging.error(f"Error getting selected recording ID: {e}")
-                return None
+        table = self._table
+        if table is None:
+            return None
+        rows = self._last_rows
+        if table.cursor_row is None or not rows:
+            return None
+        # _last_rows mirrors the table order; the ID is the first column
+        if 0 <= table.cursor_row < len(rows):
+            return int(rows[table.cursor_row][0])
         return None
 
     def select_recording(self):
@@ -79,12 +96,12 @@ class RecordingsListWidget(Container):
                 logging.warning("No recording selected")
                 return None
 
-            logging.info(f"Selecting recording ID: {recording_id}")
+            logging.info("Selecting recording ID: %s", recording_id)
             self.selected_recording_id = recording_id
             return recording_id
 
         except Exception as e:
-            logging.error(f"Error selecting recording: {e}", exc_info=True)
+            logging.error("Error selecting recording: %s", e, exc_info=True)
             return None
 
     def deselect_recording(self):
@@ -97,28 +114,26 @@ class RecordingsListWidget(Container):
         if not self.db_connected:
             return
 
-        recordings = await RecordingService.get_all_recordings()
-        table = self.query_one("#recordings-table", DataTable)
-
-        # Ensure columns are set up
-        if len(table.columns) == 0:
-            table.add_columns(
-                "ID",
-                "Name",
-                "Duration",
-                "Created",
-                "Transcript",
-                "Storage",
-                "Outputs",
-                "Status",
-            )
-            table.cursor_type = "row"
-            table.zebra_stripes = True
+        table = self._table
+        if table is None:
+            return
+
+        # Fetch one extra row to learn whether a further page exists
+        recordings = await RecordingService.get_all_recordings_for_list(
+            limit=RECORDINGS_PAGE_SIZE + 1,
+            offset=self._page * RECORDINGS_PAGE_SIZE,
+        )
+        if not recordings and self._page > 0:
+            # The last page emptied out (e.g. after deletes); step back
+            self._page -= 1
+            return await self.refresh_recordings_list()
 
-        # Clear existing rows (but keep columns)
-        table.clear(columns=False)
+        self._has_next_page = len(recordings) > RECORDINGS_PAGE_SIZE
+        recordings = recordings[:RECORDINGS_PAGE_SIZE]
+        self._update_header()
 
-        # Add recordings
+        # Build every row first so the table is rebuilt in one batch
+        rows = []
         for idx, recording in enumerate(recordings, start=1):
             duration_str = (
                 recording.duration_formatted if recording.duration else "Unknown"
@@ -133,8 +148,8 @@ class RecordingsListWidget(Container):
             analysis_str = getattr(recording, "analysis_status", "")
             status = "Archived" if recording.archived else "Active"
 
-            try:
-                table.add_row(
+            rows.append(
+                (
                     str(recording.id),
                     recording.name,
                     duration_str,
@@ -144,18 +159,86 @@ class RecordingsListWidget(Container):
                     analysis_str,
                     status,
                 )
-            except Exception as e:
-                logging.error(f"Error adding row to table: {e}")
+            )
 
             if idx % 25 == 0:
                 await asyncio.sleep(0)
 
+        # Nothing to redraw if every displayed cell is unchanged
+        if rows == self._last_rows:
+            return
+
+        try:
+            with self.app.batch_update():
+                if not self._patch_rows(table, rows):
+                    # Rows were added or reordered; rebuild (but keep columns)
+                    table.clear(columns=False)
+                    for row in rows:
+                        table.add_row(*row, key=row[0])
+            self._last_rows = rows
+        except Exception as e:
+            self._last_rows = None
+            logging.error("Error adding rows to table: %s", e)
+
+    def _patch_rows(self, table: DataTable, rows: List[Tuple[str, ...]]) -> bool:
+        """Apply rows as in-place edits; return False if a rebuild is needed
+
+        DataTable can only append rows, so the diff is applied only when the
+        new rows are the old ones minus any removals, in the same order. This
+        covers status changes, archives and deletes while keeping the cursor.
+        """
+        if self._last_rows is None:
+            return False
+        old_rows: Dict[str, Tuple[str, ...]] = {row[0]: row for row in self._last_rows}
+        new_ids = [row[0] for row in rows]
+        if not set(new_ids) <= old_rows.keys():
+            return False
+        kept = set(new_ids)
+        if [row_id for row_id in old_rows if row_id in kept] != new_ids:
+            return False
+
+        for row_id in old_rows.keys() - kept:
+            table.remove_row(row_id)
+        for row in rows:
+            old_row = old_rows[row[0]]
+            if row == old_row:
+                continue
+            for column_key, old_value, value in zip(self._column_keys, old_row, row):
+                if value != old_value:
+                    table.update_cell(row[0], column_key, value)
+        return True
+
+    def _update_header(self) -> None:
+        if self._header is None:
+            return
+        if self._page == 0 and not self._has_next_page:
+            self._header.update("Recordings List - Use ↑↓ to navigate")
+        else:
+            self._header.update(
+                f"Recordings List - Page {self._page + 1} - "
+                "Use ↑↓ to navigate, [ ] to change page"
+            )
+
+    def action_next_page(self):
+        """Show the next page of older recordings"""
+        if self._has_next_page:
+            self._page += 1
+            # Unknown until the new page loads; stops paging past the end
+            self._has_next_page = False
+            self.app.schedule_refresh()
+
+    def action_prev_page(self):
+        """Show the previous page of newer recordings"""
+        if self._page > 0:
+            self._page -= 1
+            self.app.schedule_refresh()
+
     async def archive_recording(self, recording_id: int):
         """Archive the specified recording"""
         if self.db_connected:
             await RecordingService.archive_recording(recording_id)
             self.deselect_recording()
-            await self.refresh_recordings_list()
+            self.app.schedule_refresh()
 
     async def delete_recording(self, recording_id: int):
         """Delete the specified recording"""
@@ -163,7 +246,7 @@ class RecordingsListWidget(Container):
             # TODO: Add confirmation dialog
             await RecordingService.delete_recording(recording_id)
             self.deselect_recording()
-            await self.refresh_recordings_list()
+            self.app.schedule_refresh()
 
     def set_db_connected(self, connected: bool):
         """Update database connection status"""